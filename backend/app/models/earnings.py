@@ -14,6 +14,11 @@ class HistoricalEarningsData(BaseModel):
     beta_market: float
     past_surprise: Optional[float] = None
 
+class EarningsEvent(BaseModel):
+    symbol: str
+    earnings_date: date
+    session: str
+
 class PredictionResult(BaseModel):
     symbol: str
     earnings_date: date
@@ -24,11 +29,74 @@ class PredictionResult(BaseModel):
 class UpcomingEarnings(BaseModel):
     symbol: str
     earnings_date: date
+    session: Optional[str] = None
     current_price: float
     iv_proxy: float
     predicted_gap_pct: Optional[float] = None
     opportunity_score: Optional[float] = None
 
+class ScreenerCandidate(BaseModel):
+    symbol: str
+    earnings_date: date
+    session: str
+    days_to_event: int
+    sector: str
+    current_price: float
+    iv_proxy: float
+    momentum_20d: float
+    predicted_gap_pct: float
+    opportunity_score: float
+
+class ScreenerResponse(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    results: list[ScreenerCandidate]
+
+class HistoryAggregate(BaseModel):
+    period: str
+    start_date: date
+    events: int
+    mean_gap_pct: float
+    mean_abs_gap_pct: float
+    mean_iv_proxy: float
+    mean_realized_vol: float
+
 class EarningsHistoryResponse(BaseModel):
     symbol: str
-    historical_data: list[HistoricalEarningsData]
\ No newline at end of file
+    historical_data: list[HistoricalEarningsData]
+    total_events: Optional[int] = None
+    downsampled: bool = False
+    summary: Optional[HistoryAggregate] = None
+    aggregates: Optional[list[HistoryAggregate]] = None
+
+class SurfaceRange(BaseModel):
+    min: float
+    max: float
+    steps: int = 10
+
+class PredictionSurface(BaseModel):
+    symbol: str
+    earnings_date: date
+    current_price: float
+    iv_proxy_values: list[float]
+    momentum_20d_values: list[float]
+    beta_market_values: list[float]
+    # Grids are indexed [iv_proxy][momentum_20d][beta_market]
+    predicted_gap_pct: list[list[list[float]]]
+    opportunity_score: list[list[list[float]]]
+
+class PredictionExplanation(BaseModel):
+    symbol: str
+    earnings_date: date
+    iv_proxy: float
+    current_price: float
+    predicted_gap_pct: float
+    base_value: float
+    contributions: dict[str, float]
+    input_contributions: dict[str, float]
+
+class ExplanationResponse(BaseModel):
+    model_version: str
+    feature_importances: dict[str, int]
+    explanations: list[PredictionExplanation]
@@ -1,50 +1,49 @@
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from datetime import datetime
+from typing import List, Optional
 import pandas as pd
-from datetime import datetime, date
-import os
+import numpy as np
 
-from ..models.earnings import UpcomingEarnings, EarningsHistoryResponse, HistoricalEarningsData
-from ..services.data_collector import DataCollector
-from ..services.model_trainer import EarningsPredictor
+from ..models.earnings import (
+    UpcomingEarnings, EarningsHistoryResponse, HistoricalEarningsData, EarningsEvent,
+    ScreenerCandidate, ScreenerResponse, HistoryAggregate
+)
+from ..services.model_registry import registry
+from ..services.dataset_store import dataset_store
+from ..services.earnings_calendar import calendar, HORIZON_DAYS
+from ..services.screener import screener, snapshot, SECTORS
+from ..services.history_series import history_series, AGGREGATE_PERIODS
 
 router = APIRouter()
 
 @router.get("/upcoming", response_model=List[UpcomingEarnings])
-async def get_upcoming_earnings():
+def get_upcoming_earnings(days: int = Query(14, ge=1, le=HORIZON_DAYS)):
     """Get upcoming earnings with predictions and opportunity scores"""
     try:
-        collector = DataCollector()
-        predictor = EarningsPredictor()
-        
-        # Load model if available
+        # Served from the cached upcoming snapshot, scored once per snapshot and model version
         try:
-            predictor.load_model()
+            events = screener.scored(registry.get_predictor())
             model_available = True
         except FileNotFoundError:
+            events, _ = snapshot.get()
             model_available = False
         
-        upcoming = collector.get_upcoming_earnings()
-        results = []
-        
-        for item in upcoming:
-            result = UpcomingEarnings(**item)
-            
-            # Add predictions if model is available
-            if model_available:
-                try:
-                    predicted_gap = predictor.predict_single(
-                        symbol=item['symbol'],
-                        iv_proxy=item['iv_proxy'],
-                        prev_close=item['current_price']
-                    )
-                    
-                    result.predicted_gap_pct = predicted_gap
-                    result.opportunity_score = item['iv_proxy'] - predicted_gap
-                except Exception as e:
-                    print(f"Prediction error for {item['symbol']}: {e}")
-            
-            results.append(result)
+        today = np.datetime64(datetime.now().date(), 'D')
+        event_dates = events['earnings_date'].to_numpy(dtype='datetime64[D]')
+        events = events[(event_dates >= today) & (event_dates <= today + np.timedelta64(days, 'D'))]
+        
+        results = [
+            UpcomingEarnings(
+                symbol=row['symbol'],
+                earnings_date=row['earnings_date'].date(),
+                session=row['session'],
+                current_price=row['current_price'],
+                iv_proxy=row['iv_proxy'],
+                predicted_gap_pct=row.get('predicted_gap_pct'),
+                opportunity_score=row.get('opportunity_score')
+            )
+            for row in events.to_dict('records')
+        ]
         
         # Sort by opportunity score (descending)
         if model_available:
@@ -55,26 +54,96 @@ async def get_upcoming_earnings():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/screener", response_model=ScreenerResponse)
+def screen_opportunities(
+    sector: Optional[List[str]] = Query(
+        None, description=f"Any of {', '.join(SECTORS)}; only the symbols in SECTOR_SYMBOLS have a sector other than 'other'"
+    ),
+    min_price: Optional[float] = Query(None, ge=0),
+    max_price: Optional[float] = Query(None, ge=0),
+    min_iv_proxy: Optional[float] = Query(None, ge=0),
+    max_days: Optional[int] = Query(None, ge=0, le=HORIZON_DAYS),
+    top_k: Optional[int] = Query(None, ge=1),
+    ascending: bool = False,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500)
+):
+    """Rank every upcoming event in the tracked universe by opportunity score"""
+    if sector:
+        unknown = set(sector) - set(SECTORS)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown sector(s): {', '.join(sorted(unknown))}")
+    
+    try:
+        try:
+            predictor = registry.get_predictor()
+        except FileNotFoundError:
+            raise HTTPException(status_code=503, detail="Prediction model not available. Train model first.")
+        
+        total, page = screener.screen(
+            predictor, sectors=sector, min_price=min_price, max_price=max_price,
+            min_iv_proxy=min_iv_proxy, max_days=max_days, top_k=top_k,
+            ascending=ascending, offset=offset, limit=limit
+        )
+        
+        results = [
+            ScreenerCandidate(
+                symbol=row['symbol'],
+                earnings_date=row['earnings_date'].date(),
+                session=row['session'],
+                days_to_event=row['days_to_event'],
+                sector=row['sector'],
+                current_price=row['current_price'],
+                iv_proxy=row['iv_proxy'],
+                momentum_20d=row['momentum_20d'],
+                predicted_gap_pct=row['predicted_gap_pct'],
+                opportunity_score=row['opportunity_score']
+            )
+            for row in page.to_dict('records')
+        ]
+        
+        return ScreenerResponse(total=total, offset=offset, limit=limit, results=results)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/next/{symbol}", response_model=EarningsEvent)
+def get_next_earnings(symbol: str):
+    """Get the next scheduled earnings event for a symbol"""
+    try:
+        event = calendar.get_index().next_event(symbol)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Earnings calendar unavailable: {e}")
+    
+    if event is None:
+        raise HTTPException(status_code=404, detail=f"No upcoming earnings found for symbol {symbol}")
+    return EarningsEvent(**event)
+
 @router.get("/history/{symbol}", response_model=EarningsHistoryResponse)
-async def get_earnings_history(symbol: str):
+def get_earnings_history(
+    symbol: str,
+    points: Optional[int] = Query(None, ge=3, le=5000, description="Downsample to at most this many events"),
+    aggregate: Optional[str] = Query(None, description=f"Per-period means: {' or '.join(AGGREGATE_PERIODS)}")
+):
     """Get historical earnings data for a specific symbol"""
+    if aggregate is not None and aggregate not in AGGREGATE_PERIODS:
+        raise HTTPException(status_code=400, detail=f"Unknown aggregate '{aggregate}'")
+    
     try:
-        data_path = "backend/data/historical_earnings.csv"
-        
-        if not os.path.exists(data_path):
+        try:
+            history = history_series.get(symbol, points=points, aggregate=aggregate)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="Historical data not found. Run data pipeline first.")
         
-        df = pd.read_csv(data_path)
-        symbol_data = df[df['symbol'] == symbol.upper()]
-        
-        if len(symbol_data) == 0:
+        if history is None:
             raise HTTPException(status_code=404, detail=f"No historical data found for symbol {symbol}")
         
-        historical_records = []
-        for _, row in symbol_data.iterrows():
-            record = HistoricalEarningsData(
+        historical_records = [
+            HistoricalEarningsData(
                 symbol=row['symbol'],
-                earnings_date=datetime.strptime(row['earnings_date'], '%Y-%m-%d').date(),
+                earnings_date=row['earnings_date'].date(),
                 prev_close=row['prev_close'],
                 post_open=row['post_open'],
                 overnight_gap_pct=row['overnight_gap_pct'],
@@ -82,33 +151,43 @@ async def get_earnings_history(symbol: str):
                 iv_proxy=row['iv_proxy'],
                 momentum_20d=row['momentum_20d'],
                 beta_market=row['beta_market'],
-                past_surprise=row.get('past_surprise')
+                past_surprise=None if pd.isna(row['past_surprise']) else row['past_surprise']
             )
-            historical_records.append(record)
-        
-        # Sort by date (most recent first)
-        historical_records.sort(key=lambda x: x.earnings_date, reverse=True)
+            # Most recent first
+            for row in history['rows'].iloc[::-1].to_dict('records')
+        ]
+        
+        aggregates = None
+        if history['aggregates'] is not None:
+            aggregates = [
+                HistoryAggregate(**{**row, 'start_date': row['start_date'].date()})
+                for row in history['aggregates'].to_dict('records')
+            ]
+        summary = history['summary']
         
         return EarningsHistoryResponse(
             symbol=symbol.upper(),
-            historical_data=historical_records
+            historical_data=historical_records,
+            total_events=history['total_events'],
+            downsampled=len(historical_records) < history['total_events'],
+            summary=HistoryAggregate(**{**summary, 'start_date': summary['start_date'].date()}),
+            aggregates=aggregates
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
-        if "404" in str(e):
-            raise e
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/symbols")
-async def get_available_symbols():
+def get_available_symbols():
     """Get list of symbols with historical data"""
     try:
-        data_path = "backend/data/historical_earnings.csv"
-        
-        if not os.path.exists(data_path):
+        try:
+            df = dataset_store.get_frame()
+        except FileNotFoundError:
             return {"symbols": [], "count": 0}
         
-        df = pd.read_csv(data_path)
         symbols = sorted(df['symbol'].unique().tolist())
         
         return {"symbols": symbols, "count": len(symbols)}
@@ -1,14 +1,25 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import List, Optional
 from datetime import date
+import numpy as np
 
-from ..models.earnings import PredictionResult
+from ..models.earnings import (
+    PredictionResult, PredictionSurface, SurfaceRange, PredictionExplanation, ExplanationResponse
+)
+from ..services.model_registry import registry
 from ..services.model_trainer import EarningsPredictor
 from ..services.data_collector import DataCollector
+from ..services.explainer import explainer, by_input
 
 router = APIRouter()
 
+# Largest what-if grid evaluated in one request
+MAX_SURFACE_POINTS = 20000
+
+# Most predictions explained in one request
+MAX_EXPLAIN_ROWS = 1000
+
 class PredictionRequest(BaseModel):
     symbol: str
     earnings_date: date
@@ -18,15 +29,14 @@ class PredictionRequest(BaseModel):
     beta_market: Optional[float] = 1.0
 
 @router.post("/predict", response_model=PredictionResult)
-async def predict_earnings_move(request: PredictionRequest):
+def predict_earnings_move(request: PredictionRequest):
     """Predict earnings move for a specific stock"""
     try:
-        predictor = EarningsPredictor()
         collector = DataCollector()
         
         # Load model
         try:
-            predictor.load_model()
+            predictor = registry.get_predictor()
         except FileNotFoundError:
             raise HTTPException(status_code=503, detail="Prediction model not available. Train model first.")
         
@@ -67,28 +77,164 @@ async def predict_earnings_move(request: PredictionRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+class ExplainRequest(BaseModel):
+    predictions: List[PredictionRequest] = Field(..., min_length=1, max_length=MAX_EXPLAIN_ROWS)
+
+@router.post("/explain", response_model=ExplanationResponse)
+def explain_predictions(request: ExplainRequest):
+    """Per-feature contributions to the predicted move for one or many predictions"""
+    try:
+        rows = request.predictions
+        
+        # Fill missing IV proxy / price with one bulk price fetch per request
+        incomplete = [row for row in rows if row.iv_proxy is None or row.current_price is None]
+        if incomplete:
+            collector = DataCollector()
+            prices = collector.get_bulk_stock_data(sorted({row.symbol for row in incomplete}), "6mo")
+            if not prices:
+                raise HTTPException(status_code=404, detail="Could not fetch price data")
+            
+            current_price = prices['Close'].ffill().iloc[-1]
+            for earnings_date in {row.earnings_date for row in incomplete}:
+                iv_proxy = collector.calculate_iv_proxy_bulk(
+                    prices['Close'], prices['High'], prices['Low'], earnings_date
+                )
+                for row in incomplete:
+                    if row.earnings_date != earnings_date:
+                        continue
+                    if row.symbol not in current_price.index or np.isnan(current_price[row.symbol]):
+                        raise HTTPException(status_code=404, detail=f"Could not fetch data for symbol {row.symbol}")
+                    if row.iv_proxy is None:
+                        row.iv_proxy = float(iv_proxy[row.symbol])
+                    if row.current_price is None:
+                        row.current_price = float(current_price[row.symbol])
+        
+        try:
+            explained = explainer.explain(
+                symbol=np.array([row.symbol for row in rows]),
+                iv_proxy=np.array([row.iv_proxy for row in rows]),
+                momentum_20d=np.array([row.momentum_20d for row in rows]),
+                beta_market=np.array([row.beta_market for row in rows]),
+                prev_close=np.array([row.current_price for row in rows])
+            )
+        except FileNotFoundError:
+            raise HTTPException(status_code=503, detail="Prediction model not available. Train model first.")
+        
+        features = explained['feature_columns']
+        contributions = explained['contributions']
+        inputs = by_input(features, contributions)
+        
+        explanations = [
+            PredictionExplanation(
+                symbol=row.symbol,
+                earnings_date=row.earnings_date,
+                iv_proxy=row.iv_proxy,
+                current_price=row.current_price,
+                predicted_gap_pct=explained['predicted'][i],
+                base_value=explained['base_value'][i],
+                contributions=dict(zip(features, contributions[i].tolist())),
+                input_contributions={name: float(values[i]) for name, values in inputs.items()}
+            )
+            for i, row in enumerate(rows)
+        ]
+        
+        return ExplanationResponse(
+            model_version=explained['version'],
+            feature_importances=explained['feature_importances'],
+            explanations=explanations
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+class SurfaceRequest(BaseModel):
+    symbol: str
+    earnings_date: Optional[date] = None
+    current_price: Optional[float] = None
+    iv_proxy: SurfaceRange
+    momentum_20d: SurfaceRange = SurfaceRange(min=0.0, max=0.0, steps=1)
+    beta_market: SurfaceRange = SurfaceRange(min=1.0, max=1.0, steps=1)
+
+@router.post("/surface", response_model=PredictionSurface)
+def predict_surface(request: SurfaceRequest):
+    """Predicted gap and opportunity score over a grid of iv_proxy, momentum and beta values"""
+    axes = {
+        'iv_proxy': request.iv_proxy,
+        'momentum_20d': request.momentum_20d,
+        'beta_market': request.beta_market
+    }
+    for name, axis in axes.items():
+        if axis.steps < 1 or axis.min > axis.max:
+            raise HTTPException(status_code=400, detail=f"Invalid range for {name}: need min <= max and steps >= 1")
+    
+    grid_size = request.iv_proxy.steps * request.momentum_20d.steps * request.beta_market.steps
+    if grid_size > MAX_SURFACE_POINTS:
+        raise HTTPException(status_code=400, detail=f"Grid has {grid_size} points; the limit is {MAX_SURFACE_POINTS}")
+    
+    try:
+        try:
+            predictor = registry.get_predictor()
+        except FileNotFoundError:
+            raise HTTPException(status_code=503, detail="Prediction model not available. Train model first.")
+        
+        if request.current_price is None:
+            stock_data = DataCollector().get_stock_data(request.symbol, "6mo")
+            if stock_data.empty:
+                raise HTTPException(status_code=404, detail=f"Could not fetch data for symbol {request.symbol}")
+            request.current_price = float(stock_data['Close'].iloc[-1])
+        
+        values = {name: np.linspace(axis.min, axis.max, axis.steps) for name, axis in axes.items()}
+        iv_grid, momentum_grid, beta_grid = np.meshgrid(
+            values['iv_proxy'], values['momentum_20d'], values['beta_market'], indexing='ij'
+        )
+        
+        # One batched model call over the flattened grid
+        predicted = predictor.predict_batch(
+            symbol=request.symbol,
+            iv_proxy=iv_grid.ravel(),
+            momentum_20d=momentum_grid.ravel(),
+            beta_market=beta_grid.ravel(),
+            prev_close=request.current_price
+        ).reshape(iv_grid.shape)
+        opportunity = iv_grid - predicted
+        
+        return PredictionSurface(
+            symbol=request.symbol,
+            earnings_date=request.earnings_date or date.today(),
+            current_price=request.current_price,
+            iv_proxy_values=values['iv_proxy'].tolist(),
+            momentum_20d_values=values['momentum_20d'].tolist(),
+            beta_market_values=values['beta_market'].tolist(),
+            predicted_gap_pct=predicted.tolist(),
+            opportunity_score=opportunity.tolist()
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.get("/model/status")
 async def get_model_status():
     """Get model training status and performance metrics"""
     try:
-        import joblib
-        import os
-        
-        model_path = "backend/models/earnings_predictor.joblib"
-        
-        if not os.path.exists(model_path):
+        try:
+            model_data = EarningsPredictor().load_metadata()
+        except FileNotFoundError:
             return {
                 "available": False,
                 "message": "Model not trained yet"
             }
         
-        model_data = joblib.load(model_path)
-        
         return {
             "available": True,
             "training_date": model_data.get('training_date'),
             "performance": model_data.get('performance', {}),
-            "feature_count": len(model_data.get('feature_columns', []))
+            "feature_count": len(model_data.get('feature_columns', [])),
+            "training": model_data.get('training'),
+            "backend": registry.backend
         }
         
     except Exception as e:
@@ -98,17 +244,26 @@ async def get_model_status():
         }
 
 @router.post("/model/retrain")
-async def retrain_model():
-    """Retrain the prediction model with latest data"""
+def retrain_model(incremental: bool = False, compare_full: bool = False):
+    """Retrain the prediction model with latest data, or only boost it on new events with incremental=true.
+    
+    With compare_full=true an incremental update also fits a full rebuild in
+    memory and records its metrics next to the update's.
+    """
     try:
-        from ..services.model_trainer import EarningsPredictor
-        
         predictor = EarningsPredictor()
-        model = predictor.train_model()
+        if incremental:
+            predictor.update_model(compare_full=compare_full)
+        else:
+            predictor.train_model()
+        registry.invalidate()
         
+        metadata = predictor.load_metadata()
         return {
             "success": True,
-            "message": "Model retrained successfully"
+            "message": "Model retrained successfully",
+            "training": metadata.get('training'),
+            "update": metadata.get('update')
         }
         
     except FileNotFoundError:
@@ -0,0 +1,156 @@
+import pandas as pd
+import numpy as np
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from .model_trainer import EarningsPredictor, FEATURE_COLUMNS, drop_incomplete
+from .shared_store import file_version
+
+# Arrays published once per dataset and memory-mapped by every worker
+_CACHED_ARRAYS = ('X', 'y', 'iv_proxy')
+_worker_arrays: Dict[str, np.ndarray] = {}
+
+
+def implied_move_pct(iv_proxy: np.ndarray) -> np.ndarray:
+    """One-day move implied by an annualized volatility in %"""
+    return iv_proxy / np.sqrt(252)
+
+
+def _init_worker(cache_dir: str):
+    for name in _CACHED_ARRAYS:
+        _worker_arrays[name] = np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode='r')
+
+
+def _run_step(step: Tuple[int, int, int]) -> Tuple[int, np.ndarray]:
+    """Fit on rows [0, train_end) and predict rows [train_end, test_end)"""
+    step_id, train_end, test_end = step
+    X, y = _worker_arrays['X'], _worker_arrays['y']
+
+    # One thread per fit; the pool already runs one process per core
+    model = EarningsPredictor().build_model().set_params(n_jobs=1)
+    model.fit(pd.DataFrame(X[:train_end], columns=FEATURE_COLUMNS), y[:train_end])
+    predictions = model.predict(pd.DataFrame(X[train_end:test_end], columns=FEATURE_COLUMNS))
+    return step_id, predictions
+
+
+class WalkForwardBacktester:
+    """Walk-forward evaluation of the opportunity score ranking.
+
+    Events are sorted by date and split into consecutive periods. For each
+    period the model is retrained on every event strictly before it and
+    used to score the events inside it, so no prediction sees its own
+    outcome. Steps run in separate processes which memory-map the feature
+    matrix from a cache built once per dataset version.
+    """
+
+    def __init__(self, data_path: str = "backend/data/historical_earnings.csv",
+                 cache_dir: str = "backend/data/cache", step: str = "QS",
+                 min_train_events: int = 200, n_deciles: int = 10,
+                 max_workers: Optional[int] = None):
+        self.data_path = data_path
+        self.cache_dir = cache_dir
+        self.step = step
+        self.min_train_events = min_train_events
+        self.n_deciles = n_deciles
+        self.max_workers = max_workers
+
+    def load_events(self) -> Tuple[pd.DataFrame, str]:
+        """Date-sorted events with features, plus the directory of their cached arrays"""
+        if not os.path.exists(self.data_path):
+            raise FileNotFoundError(f"Dataset not found at {self.data_path}. Run data_pipeline.py first.")
+
+        # Keyed by feature set too, so adding features invalidates the cache
+        features_key = hashlib.sha1(','.join(FEATURE_COLUMNS).encode()).hexdigest()[:8]
+        version_dir = os.path.join(self.cache_dir, f"backtest_{file_version(self.data_path)}_{features_key}")
+        events_path = os.path.join(version_dir, "events.pkl")
+
+        if os.path.exists(events_path):
+            print(f"Reusing cached features from {version_dir}")
+            return pd.read_pickle(events_path), version_dir
+
+        print("Building feature cache...")
+        df = pd.read_csv(self.data_path)
+        features_df = EarningsPredictor().prepare_features(df)
+        features_df = drop_incomplete(features_df, FEATURE_COLUMNS + ['target'])
+        features_df = features_df.sort_values('earnings_date', kind='mergesort').reset_index(drop=True)
+
+        os.makedirs(version_dir, exist_ok=True)
+        np.save(os.path.join(version_dir, "X.npy"), features_df[FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+        np.save(os.path.join(version_dir, "y.npy"), features_df['target'].to_numpy(dtype=np.float64))
+        np.save(os.path.join(version_dir, "iv_proxy.npy"), features_df['iv_proxy'].to_numpy(dtype=np.float64))
+
+        events = features_df[['symbol', 'earnings_date', 'iv_proxy', 'target']]
+        events.to_pickle(events_path)
+        return events, version_dir
+
+    def build_steps(self, dates: pd.Series) -> List[Tuple[int, int, int]]:
+        """(step_id, train_end, test_end) row bounds for each walk-forward period"""
+        boundaries = pd.date_range(dates.iloc[0], dates.iloc[-1], freq=self.step)
+        boundaries = boundaries.append(pd.DatetimeIndex([dates.iloc[-1] + pd.Timedelta(days=1)]))
+        positions = np.searchsorted(dates.to_numpy(), boundaries.to_numpy(), side='left')
+
+        steps = []
+        for start, end in zip(positions[:-1], positions[1:]):
+            if start < self.min_train_events or end <= start:
+                continue
+            steps.append((len(steps), int(start), int(end)))
+        return steps
+
+    def run(self) -> Dict:
+        """Run the backtest and return per-event scores and per-decile metrics"""
+        events, version_dir = self.load_events()
+        steps = self.build_steps(events['earnings_date'])
+        if not steps:
+            raise ValueError(f"Not enough history for a walk-forward backtest "
+                             f"(need more than {self.min_train_events} events before the first step)")
+
+        print(f"Running {len(steps)} walk-forward steps over {steps[-1][2] - steps[0][1]} events...")
+        predictions = np.full(len(events), np.nan)
+        step_ids = np.full(len(events), -1)
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(version_dir,)) as executor:
+            for step_id, step_predictions in executor.map(_run_step, steps):
+                _, train_end, test_end = steps[step_id]
+                predictions[train_end:test_end] = step_predictions
+                step_ids[train_end:test_end] = step_id
+
+        scored = events.assign(predicted_gap_pct=predictions, step=step_ids)
+        scored = scored[scored['step'] >= 0].reset_index(drop=True)
+        scored = self.score_events(scored)
+
+        return {
+            'events': scored,
+            'deciles': self.decile_report(scored),
+            'steps': len(steps),
+        }
+
+    @staticmethod
+    def score_events(scored: pd.DataFrame) -> pd.DataFrame:
+        """Add opportunity score and short-straddle PnL proxy columns"""
+        scored = scored.copy()
+        scored['opportunity_score'] = scored['iv_proxy'] - scored['predicted_gap_pct']
+        scored['implied_move_pct'] = implied_move_pct(scored['iv_proxy'].to_numpy())
+        # Selling the event move earns the implied move minus the realized move
+        scored['pnl_proxy'] = scored['implied_move_pct'] - scored['target']
+        scored['hit'] = scored['pnl_proxy'] > 0
+        return scored
+
+    def decile_report(self, scored: pd.DataFrame) -> pd.DataFrame:
+        """Hit rate and PnL proxies per opportunity-score decile (1 = lowest score)"""
+        ranks = scored['opportunity_score'].rank(method='first')
+        deciles = pd.qcut(ranks, self.n_deciles, labels=False) + 1
+
+        report = scored.groupby(deciles).agg(
+            events=('pnl_proxy', 'size'),
+            mean_score=('opportunity_score', 'mean'),
+            mean_predicted_move=('predicted_gap_pct', 'mean'),
+            mean_actual_move=('target', 'mean'),
+            hit_rate=('hit', 'mean'),
+            mean_pnl=('pnl_proxy', 'mean'),
+            total_pnl=('pnl_proxy', 'sum'),
+        )
+        report.index.name = 'decile'
+        return report
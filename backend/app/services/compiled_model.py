@@ -0,0 +1,167 @@
+import numpy as np
+import json
+from typing import Dict, List, Tuple
+
+# LightGBM missing_type encodings used in the flattened node arrays
+MISSING_NONE = 0
+MISSING_ZERO = 1
+MISSING_NAN = 2
+
+_MISSING_TYPES = {'None': MISSING_NONE, 'Zero': MISSING_ZERO, 'NaN': MISSING_NAN}
+_ZERO_THRESHOLD = 1e-35
+_BLOCK_ROWS = 256
+_NODE_ARRAYS = ('split_feature', 'threshold', 'default_left', 'missing_type',
+                'left_child', 'right_child', 'leaf_value', 'roots')
+
+
+class CompiledTreeEnsemble:
+    """Tree ensemble flattened into NumPy node arrays.
+
+    The nodes of every tree live in one set of arrays. Leaves are stored as
+    nodes that point back to themselves, so prediction can walk all trees
+    for all rows at once, one tree level per iteration, without masking
+    finished paths. Only NumPy is needed at inference time.
+    """
+
+    def __init__(self, split_feature: np.ndarray, threshold: np.ndarray,
+                 default_left: np.ndarray, missing_type: np.ndarray,
+                 left_child: np.ndarray, right_child: np.ndarray,
+                 leaf_value: np.ndarray, roots: np.ndarray, max_depth: int,
+                 feature_names: List[str]):
+        self.split_feature = split_feature
+        self.threshold = threshold
+        self.default_left = default_left
+        self.missing_type = missing_type
+        self.left_child = left_child
+        self.right_child = right_child
+        self.leaf_value = leaf_value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.feature_names = list(feature_names)
+        self._has_missing_splits = bool((missing_type != MISSING_NONE).any())
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @classmethod
+    def from_lightgbm(cls, model) -> "CompiledTreeEnsemble":
+        """Compile a fitted LGBMRegressor (or raw Booster)"""
+        booster = model.booster_ if hasattr(model, 'booster_') else model
+        dump = booster.dump_model()
+
+        objective = dump.get('objective', 'regression').split(' ')[0]
+        if objective not in ('regression', 'regression_l1', 'huber', 'fair', 'quantile'):
+            raise ValueError(f"Cannot compile model with objective '{objective}'")
+
+        nodes: Dict[str, list] = {
+            'split_feature': [], 'threshold': [], 'default_left': [], 'missing_type': [],
+            'left_child': [], 'right_child': [], 'leaf_value': []
+        }
+        roots = []
+        max_depth = 0
+
+        def add_node(split_feature, threshold, default_left, missing_type, leaf_value):
+            idx = len(nodes['split_feature'])
+            nodes['split_feature'].append(split_feature)
+            nodes['threshold'].append(threshold)
+            nodes['default_left'].append(default_left)
+            nodes['missing_type'].append(missing_type)
+            nodes['left_child'].append(idx)
+            nodes['right_child'].append(idx)
+            nodes['leaf_value'].append(leaf_value)
+            return idx
+
+        def visit(node, depth):
+            nonlocal max_depth
+            if 'split_index' not in node:
+                max_depth = max(max_depth, depth)
+                # Leaves always go "left" to themselves
+                return add_node(0, np.inf, True, MISSING_NONE, node.get('leaf_value', 0.0))
+
+            if node.get('decision_type', '<=') != '<=':
+                raise ValueError("Categorical splits are not supported by the compiled backend")
+
+            idx = add_node(
+                node['split_feature'], node['threshold'], node.get('default_left', True),
+                _MISSING_TYPES[node.get('missing_type', 'None')], 0.0
+            )
+            nodes['left_child'][idx] = visit(node['left_child'], depth + 1)
+            nodes['right_child'][idx] = visit(node['right_child'], depth + 1)
+            return idx
+
+        for tree in dump['tree_info']:
+            roots.append(visit(tree['tree_structure'], 0))
+
+        return cls(
+            split_feature=np.asarray(nodes['split_feature'], dtype=np.int32),
+            threshold=np.asarray(nodes['threshold'], dtype=np.float64),
+            default_left=np.asarray(nodes['default_left'], dtype=bool),
+            missing_type=np.asarray(nodes['missing_type'], dtype=np.int8),
+            left_child=np.asarray(nodes['left_child'], dtype=np.int32),
+            right_child=np.asarray(nodes['right_child'], dtype=np.int32),
+            leaf_value=np.asarray(nodes['leaf_value'], dtype=np.float64),
+            roots=np.asarray(roots, dtype=np.int32),
+            max_depth=max_depth,
+            feature_names=dump.get('feature_names', []),
+        )
+
+    def predict(self, X) -> np.ndarray:
+        """Sum of leaf outputs over all trees for every row of X"""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        # Walk in row blocks so the (rows x trees) node matrix stays cache-sized
+        if X.shape[0] > _BLOCK_ROWS:
+            return np.concatenate([
+                self._predict_block(X[start:start + _BLOCK_ROWS])
+                for start in range(0, X.shape[0], _BLOCK_ROWS)
+            ])
+        return self._predict_block(X)
+
+    def _predict_block(self, X: np.ndarray) -> np.ndarray:
+        node = np.broadcast_to(self.roots, (X.shape[0], self.n_trees))
+        for _ in range(self.max_depth):
+            values = np.take_along_axis(X, self.split_feature[node], axis=1)
+            go_left = values <= self.threshold[node]
+
+            if self._has_missing_splits:
+                missing_type = self.missing_type[node]
+                is_nan = np.isnan(values)
+                # LightGBM treats NaN as zero unless the split tracks NaN explicitly
+                values = np.where(is_nan & (missing_type != MISSING_NAN), 0.0, values)
+                use_default = (
+                    ((missing_type == MISSING_NAN) & is_nan) |
+                    ((missing_type == MISSING_ZERO) & (np.abs(values) <= _ZERO_THRESHOLD))
+                )
+                go_left = np.where(use_default, self.default_left[node], values <= self.threshold[node])
+            elif np.isnan(values).any():
+                go_left |= np.isnan(values) & (0.0 <= self.threshold[node])
+
+            node = np.where(go_left, self.left_child[node], self.right_child[node])
+
+        return self.leaf_value[node].sum(axis=1)
+
+    def to_arrays(self) -> Tuple[Dict[str, np.ndarray], dict]:
+        """Node arrays plus the JSON-serializable metadata needed to rebuild the model"""
+        arrays = {name: getattr(self, name) for name in _NODE_ARRAYS}
+        meta = {'max_depth': self.max_depth, 'feature_names': self.feature_names}
+        return arrays, meta
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray], meta: dict) -> "CompiledTreeEnsemble":
+        """Rebuild from node arrays without copying them (they may be memory-mapped)"""
+        return cls(**{name: arrays[name] for name in _NODE_ARRAYS},
+                   max_depth=meta['max_depth'], feature_names=meta['feature_names'])
+
+    def save(self, path: str):
+        """Write the node arrays to a single .npz file"""
+        arrays, meta = self.to_arrays()
+        np.savez(path, meta=np.array(json.dumps(meta)), **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "CompiledTreeEnsemble":
+        with np.load(path) as data:
+            meta = json.loads(str(data['meta']))
+            return cls.from_arrays({name: data[name] for name in _NODE_ARRAYS}, meta)
@@ -1,24 +1,25 @@
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, date
 from typing import List, Dict, Optional
-import requests
-from bs4 import BeautifulSoup
-import json
 import os
 
+from .dataset_store import DatasetStore
+from .market_regime import MarketPanel, attach_regime_features
+from . import providers
+from .providers import MarketDataProvider
+
 class DataCollector:
-    def __init__(self):
+    def __init__(self, provider: Optional[MarketDataProvider] = None):
         self.data_dir = "backend/data"
         os.makedirs(self.data_dir, exist_ok=True)
+        # Shared, request-coalescing provider for the whole process by default
+        self.provider = provider or providers.provider
     
     def get_stock_data(self, symbol: str, period: str = "2y") -> pd.DataFrame:
         """Get historical stock price data"""
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period=period)
-            return data
+            return self.provider.history(symbol, period)
         except Exception as e:
             print(f"Error fetching data for {symbol}: {e}")
             return pd.DataFrame()
@@ -26,12 +27,7 @@ class DataCollector:
     def get_earnings_dates_yahoo(self, symbol: str) -> List[date]:
         """Scrape earnings dates from Yahoo Finance"""
         try:
-            ticker = yf.Ticker(symbol)
-            calendar = ticker.calendar
-            if calendar is not None and not calendar.empty:
-                return [pd.to_datetime(date).date() for date in calendar.index]
-            else:
-                return []
+            return self.provider.earnings_dates(symbol)
         except Exception as e:
             print(f"Error fetching earnings dates for {symbol}: {e}")
             return []
@@ -183,41 +179,126 @@ class DataCollector:
         
         df = pd.DataFrame(all_data)
         
+        # Point-in-time market regime, one as-of join over all events
+        if len(df) > 0:
+            from .model_trainer import sector_of
+            df = attach_regime_features(df, sector_of(df['symbol']), MarketPanel(provider=self.provider).get())
+        
         # Save to CSV
         csv_path = os.path.join(self.data_dir, "historical_earnings.csv")
         df.to_csv(csv_path, index=False)
         print(f"Saved {len(df)} records to {csv_path}")
         
+        # Publish the new version for API workers to memory-map
+        if len(df) > 0:
+            version = DatasetStore(csv_path).publish()
+            print(f"Published dataset version {version}")
+        
         return df
     
-    def get_upcoming_earnings(self) -> List[Dict]:
-        """Get upcoming earnings dates for next 2 weeks"""
-        # For MVP, we'll use a hardcoded list of major stocks with known earnings patterns
-        major_stocks = ["AAPL", "MSFT", "GOOGL", "AMZN", "TSLA", "META", "NVDA", "NFLX", "CRM", "UBER"]
-        upcoming = []
-        
-        for symbol in major_stocks:
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                current_price = info.get('currentPrice', 0)
-                
-                # For demo purposes, create some mock upcoming earnings
-                # In production, you'd scrape from earnings calendars
-                mock_date = datetime.now().date() + timedelta(days=np.random.randint(1, 14))
-                
-                stock_data = self.get_stock_data(symbol, "6mo")
-                if not stock_data.empty:
-                    iv_proxy = self.calculate_iv_proxy(stock_data, datetime.now().date())
-                    
-                    upcoming.append({
-                        'symbol': symbol,
-                        'earnings_date': mock_date,
-                        'current_price': current_price,
-                        'iv_proxy': iv_proxy
-                    })
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
-                continue
+    def get_bulk_stock_data(self, symbols: List[str], period: str = "6mo") -> Optional[Dict[str, pd.DataFrame]]:
+        """Wide Close/High/Low/Open frames (dates x symbols) fetched in one bulk download.
+        
+        Returns None when the download fails or comes back empty, so callers
+        can tell an upstream failure from having no symbols to fetch.
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            data = self.provider.bulk_history(symbols, period)
+        except Exception as e:
+            print(f"Error bulk-fetching data for {len(symbols)} symbols: {e}")
+            return None
+        
+        if data is None or data.empty:
+            return None
+        
+        fields = {}
+        for field in ['Open', 'High', 'Low', 'Close']:
+            frame = data[field]
+            if isinstance(frame, pd.Series):
+                frame = frame.to_frame(symbols[0])
+            fields[field] = frame.reindex(columns=symbols)
+        return fields
+    
+    def calculate_iv_proxy_bulk(self, close: pd.DataFrame, high: pd.DataFrame, low: pd.DataFrame,
+                                reference_date: date) -> pd.Series:
+        """calculate_iv_proxy for every column of wide price frames at once"""
+        ref_dt = pd.Timestamp(reference_date)
+        before = close.index < ref_dt
+        close, high, low = close[before].tail(30), high[before].tail(30), low[before].tail(30)
+        
+        # Historical volatility (20-day)
+        returns = close / close.shift(1) - 1
+        hv = returns.std() * np.sqrt(252) * 100
+        
+        # Average True Range (10-day)
+        prev_close = close.shift(1)
+        tr = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+        atr = tr.tail(10).mean()
+        atr_pct = (atr / close.ffill().iloc[-1]) * 100 if len(close) else atr
+        
+        iv_proxy = (hv * 0.7) + (atr_pct * 0.3 * np.sqrt(252))
+        # Same minimum history as calculate_iv_proxy
+        return iv_proxy.where(close.count() >= 20, 0.0)
+    
+    def calculate_momentum_20d_bulk(self, close: pd.DataFrame, reference_date: date) -> pd.Series:
+        """calculate_momentum_20d for every column of a wide close frame at once"""
+        ref_dt = pd.Timestamp(reference_date)
+        before = close[close.index < ref_dt]
+        if len(before) < 21:
+            return pd.Series(0.0, index=close.columns)
+        
+        filled = before.ffill()
+        current_price = filled.iloc[-1]
+        price_20d_ago = filled.iloc[-21]
+        
+        momentum = ((current_price - price_20d_ago) / price_20d_ago) * 100
+        return momentum.where(before.count() >= 21, 0.0)
+    
+    def get_upcoming_features(self, days: int = 14, calendar_index=None) -> pd.DataFrame:
+        """Upcoming events from the earnings calendar with current price, IV proxy and momentum"""
+        if calendar_index is None:
+            from .earnings_calendar import calendar
+            calendar_index = calendar.get_index()
+        
+        columns = ['symbol', 'earnings_date', 'session', 'current_price', 'iv_proxy', 'momentum_20d']
+        events = calendar_index.upcoming(days)
+        if events.empty:
+            return pd.DataFrame(columns=columns)
+        
+        symbols = events['symbol'].unique().tolist()
+        prices = self.get_bulk_stock_data(symbols, "6mo")
+        if prices is None:
+            raise RuntimeError(f"Could not fetch prices for {len(symbols)} upcoming symbols")
+        
+        today = datetime.now().date()
+        iv_proxy = self.calculate_iv_proxy_bulk(prices['Close'], prices['High'], prices['Low'], today)
+        momentum = self.calculate_momentum_20d_bulk(prices['Close'], today)
+        current_price = prices['Close'].ffill().iloc[-1]
+        
+        events = events.assign(
+            current_price=events['symbol'].map(current_price),
+            iv_proxy=events['symbol'].map(iv_proxy),
+            momentum_20d=events['symbol'].map(momentum)
+        ).dropna(subset=['current_price', 'iv_proxy'])
+        return events[columns].reset_index(drop=True)
+    
+    def get_upcoming_earnings(self, days: int = 14, calendar_index=None) -> List[Dict]:
+        """Get upcoming earnings from the earnings calendar for the next `days` days"""
+        events = self.get_upcoming_features(days, calendar_index)
         
-        return upcoming
\ No newline at end of file
+        return [
+            {
+                'symbol': symbol,
+                'earnings_date': earnings_date.date(),
+                'session': session,
+                'current_price': float(price),
+                'iv_proxy': float(iv)
+            }
+            for symbol, earnings_date, session, price, iv in zip(
+                events['symbol'], events['earnings_date'], events['session'],
+                events['current_price'], events['iv_proxy']
+            )
+        ]
\ No newline at end of file
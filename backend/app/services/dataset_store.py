@@ -0,0 +1,81 @@
+import pandas as pd
+import numpy as np
+import os
+from typing import Optional, Tuple
+
+from .shared_store import SharedArrayStore, Arrays, file_version
+
+NUMERIC_COLUMNS = [
+    'prev_close', 'post_open', 'overnight_gap_pct', 'five_day_realized_vol',
+    'iv_proxy', 'momentum_20d', 'beta_market', 'past_surprise'
+]
+
+
+def dataset_to_arrays(df: pd.DataFrame) -> Tuple[Arrays, dict]:
+    """Column arrays for the historical dataset, with symbols stored as category codes"""
+    symbols = pd.Categorical(df['symbol'])
+    arrays = {
+        'symbol_codes': symbols.codes.astype(np.int32),
+        'earnings_date': pd.to_datetime(df['earnings_date']).to_numpy(dtype='datetime64[D]'),
+    }
+    for column in NUMERIC_COLUMNS:
+        arrays[column] = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)
+
+    meta = {'symbols': [str(symbol) for symbol in symbols.categories], 'rows': len(df)}
+    return arrays, meta
+
+
+class DatasetStore:
+    """Historical dataset shared read-only across API worker processes.
+
+    The CSV is converted to column arrays once per version and published to
+    the SharedArrayStore; each worker builds a DataFrame over the
+    memory-mapped columns instead of parsing its own copy.
+    """
+
+    def __init__(self, data_path: str = "backend/data/historical_earnings.csv",
+                 store: Optional[SharedArrayStore] = None):
+        self.data_path = data_path
+        self.store = store or SharedArrayStore()
+        self._frame = None
+        self._version = None
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version of the dataset currently loaded in this process"""
+        return self._version
+
+    def publish(self) -> str:
+        """Publish the CSV as a new dataset version and return that version"""
+        version = file_version(self.data_path)
+        arrays, meta = dataset_to_arrays(pd.read_csv(self.data_path))
+        self.store.publish("dataset", version, arrays, meta)
+        self.store.prune("dataset")
+        return version
+
+    def get_frame(self) -> pd.DataFrame:
+        """DataFrame over the shared columns of the current dataset version"""
+        if not os.path.exists(self.data_path):
+            raise FileNotFoundError(f"Historical data not found at {self.data_path}. Run data pipeline first.")
+
+        version = file_version(self.data_path)
+        if self._frame is not None and version == self._version:
+            return self._frame
+
+        arrays, meta, _ = self.store.ensure(
+            "dataset", version, lambda: dataset_to_arrays(pd.read_csv(self.data_path))
+        )
+
+        columns = {
+            'symbol': pd.Categorical.from_codes(arrays['symbol_codes'], categories=meta['symbols']),
+            'earnings_date': arrays['earnings_date'],
+        }
+        columns.update({column: arrays[column] for column in NUMERIC_COLUMNS})
+
+        # copy=False keeps the numeric columns backed by the memory-mapped files
+        self._frame = pd.DataFrame(columns, copy=False)
+        self._version = version
+        return self._frame
+
+
+dataset_store = DatasetStore()
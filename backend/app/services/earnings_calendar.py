@@ -0,0 +1,227 @@
+import pandas as pd
+import numpy as np
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional
+
+# Report timing relative to the trading session
+SESSIONS = ("BMO", "AMC", "UNKNOWN")
+
+# Days ahead the provider calendar is loaded for; upcoming queries stay within it
+HORIZON_DAYS = 30
+
+
+def _normalize_events(df: pd.DataFrame) -> pd.DataFrame:
+    """symbol / earnings_date / session frame with one row per event"""
+    events = pd.DataFrame({
+        'symbol': df['symbol'].astype(str).str.upper().str.strip(),
+        'earnings_date': pd.to_datetime(df['earnings_date']).dt.normalize(),
+    })
+    if 'session' in df.columns:
+        session = df['session'].fillna('UNKNOWN').astype(str).str.upper()
+        events['session'] = session.where(session.isin(SESSIONS), 'UNKNOWN')
+    else:
+        events['session'] = 'UNKNOWN'
+
+    events = events.dropna(subset=['earnings_date'])
+    return events.drop_duplicates(subset=['symbol', 'earnings_date']).reset_index(drop=True)
+
+
+class CalendarSource:
+    """Loads earnings events in bulk as a symbol / earnings_date / session frame"""
+
+    def load(self) -> pd.DataFrame:
+        raise NotImplementedError
+
+
+class StaticCalendarSource(CalendarSource):
+    """In-memory events, used as an offline stand-in for a provider"""
+
+    def __init__(self, events):
+        self.events = pd.DataFrame(events)
+
+    def load(self) -> pd.DataFrame:
+        return _normalize_events(self.events)
+
+
+class FileCalendarSource(CalendarSource):
+    """CSV file with symbol, earnings_date and an optional session column"""
+
+    def __init__(self, path: str = "backend/data/earnings_calendar.csv"):
+        self.path = path
+
+    def load(self) -> pd.DataFrame:
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Earnings calendar not found at {self.path}")
+        return _normalize_events(pd.read_csv(self.path))
+
+
+class YahooCalendarSource(CalendarSource):
+    """Yahoo Finance earnings calendar for the whole US market, fetched page by page"""
+
+    PAGE_SIZE = 100  # Yahoo caps calendar pages at 100 rows
+
+    def __init__(self, days_ahead: int = HORIZON_DAYS, max_pages: int = 100, session=None):
+        self.days_ahead = days_ahead
+        self.max_pages = max_pages
+        self.session = session
+
+    def load(self) -> pd.DataFrame:
+        import yfinance as yf
+        from .providers import yahoo_session
+
+        start = datetime.now().date()
+        end = start + timedelta(days=self.days_ahead)
+        # Same pooled session as the price provider rather than a fresh client per load
+        calendars = yf.Calendars(start=start, end=end, session=self.session or yahoo_session())
+
+        pages = []
+        for page in range(self.max_pages):
+            df = calendars.get_earnings_calendar(
+                start=start, end=end, limit=self.PAGE_SIZE,
+                offset=page * self.PAGE_SIZE, filter_most_active=False, force=True
+            )
+            if df is None or df.empty:
+                break
+            pages.append(df.reset_index())
+            if len(df) < self.PAGE_SIZE:
+                break
+
+        if not pages:
+            return _normalize_events(pd.DataFrame(columns=['symbol', 'earnings_date', 'session']))
+
+        raw = pd.concat(pages, ignore_index=True)
+        return _normalize_events(pd.DataFrame({
+            'symbol': raw['Symbol'],
+            'earnings_date': pd.to_datetime(raw['Event Start Date']).dt.tz_localize(None),
+            'session': raw['Timing'] if 'Timing' in raw.columns else 'UNKNOWN',
+        }))
+
+
+class EarningsCalendarIndex:
+    """Date-sorted earnings events (as loaded by a CalendarSource) with per-symbol positions.
+
+    Date-window queries are a binary search over one sorted datetime64
+    array; per-symbol queries binary-search that symbol's own sorted dates.
+    Neither scans the universe symbol by symbol.
+    """
+
+    def __init__(self, events: pd.DataFrame):
+        events = events.sort_values(['earnings_date', 'symbol'], kind='mergesort').reset_index(drop=True)
+
+        self.events = events
+        self.dates = events['earnings_date'].to_numpy(dtype='datetime64[D]')
+        self.symbols = events['symbol'].to_numpy()
+        self.sessions = events['session'].to_numpy()
+
+        # Positions are already date-ordered within each symbol
+        self._by_symbol: Dict[str, np.ndarray] = {
+            symbol: positions
+            for symbol, positions in events.groupby('symbol', sort=False).indices.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def universe(self) -> List[str]:
+        return sorted(self._by_symbol)
+
+    def _bounds(self, start: date, end: date) -> slice:
+        left = np.searchsorted(self.dates, np.datetime64(start, 'D'), side='left')
+        right = np.searchsorted(self.dates, np.datetime64(end, 'D'), side='right')
+        return slice(left, right)
+
+    def between(self, start: date, end: date, session: Optional[str] = None) -> pd.DataFrame:
+        """Events with start <= earnings_date <= end, optionally for one session"""
+        window = self.events.iloc[self._bounds(start, end)]
+        if session is not None:
+            window = window[window['session'] == session.upper()]
+        return window
+
+    def upcoming(self, days: int = 14, today: Optional[date] = None,
+                 session: Optional[str] = None) -> pd.DataFrame:
+        """Events in the next `days` days, today included"""
+        today = today or datetime.now().date()
+        return self.between(today, today + timedelta(days=days), session)
+
+    def next_event(self, symbol: str, after: Optional[date] = None) -> Optional[Dict]:
+        """First event for `symbol` on or after `after` (today by default)"""
+        positions = self._by_symbol.get(symbol.upper())
+        if positions is None:
+            return None
+
+        after = after or datetime.now().date()
+        i = np.searchsorted(self.dates[positions], np.datetime64(after, 'D'), side='left')
+        if i == len(positions):
+            return None
+
+        row = self.events.iloc[positions[i]]
+        return {
+            'symbol': row['symbol'],
+            'earnings_date': row['earnings_date'].date(),
+            'session': row['session']
+        }
+
+
+class EarningsCalendar:
+    """Process-wide calendar index, reloaded from its source every `ttl` seconds.
+
+    A failed reload keeps serving the last good index and is retried after
+    `retry_after` seconds rather than on every request. Only when no index
+    has loaded yet does get_index raise, with the last load error.
+    """
+
+    def __init__(self, source: Optional[CalendarSource] = None, ttl: float = 3600,
+                 retry_after: float = 60):
+        self.source = source or calendar_source_from_env()
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self._index = None
+        self._loaded_at = 0.0
+        self._failed_at = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def get_index(self) -> EarningsCalendarIndex:
+        with self._lock:
+            now = time.monotonic()
+            stale = self._index is None or now - self._loaded_at > self.ttl
+            backing_off = self._failed_at is not None and now - self._failed_at < self.retry_after
+            if stale and not backing_off:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    self._failed_at = now
+                    self._error = e
+                    print(f"Error loading earnings calendar: {e}")
+
+            if self._index is None:
+                raise self._error
+            return self._index
+
+    def refresh(self) -> EarningsCalendarIndex:
+        events = self.source.load()
+        self._index = EarningsCalendarIndex(events)
+        self._loaded_at = time.monotonic()
+        self._failed_at = None
+        self._error = None
+        print(f"Loaded {len(self._index)} earnings events for {len(self._index.universe)} symbols")
+        return self._index
+
+
+def calendar_source_from_env() -> CalendarSource:
+    """EARNINGS_CALENDAR_SOURCE selects "file" or "yahoo"; by default the file is used when present"""
+    path = os.getenv("EARNINGS_CALENDAR_FILE", "backend/data/earnings_calendar.csv")
+    source = os.getenv("EARNINGS_CALENDAR_SOURCE", "auto")
+
+    if source == "file" or (source == "auto" and os.path.exists(path)):
+        return FileCalendarSource(path)
+    if source in ("yahoo", "auto"):
+        return YahooCalendarSource()
+    raise ValueError(f"Unknown EARNINGS_CALENDAR_SOURCE '{source}'")
+
+
+calendar = EarningsCalendar()
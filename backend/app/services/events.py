@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+import json
+import os
+from typing import AsyncIterator, Callable, Dict, Optional
+
+from .shared_store import file_version
+from .model_registry import registry
+from .dataset_store import dataset_store
+from .screener import snapshot
+
+
+def refresh_snapshot():
+    """Rebuild the upcoming snapshot if it has expired, so its version moves without a client request"""
+    if snapshot.stale():
+        try:
+            snapshot.get()
+        except Exception as e:
+            print(f"Background snapshot rebuild failed: {e}")
+
+
+def current_versions() -> Dict[str, Optional[str]]:
+    """Versions of the served model, the historical dataset and the upcoming snapshot"""
+    model_path = registry.artifact_path()
+    data_path = dataset_store.data_path
+    return {
+        'model': file_version(model_path) if os.path.exists(model_path) else None,
+        'dataset': file_version(data_path) if os.path.exists(data_path) else None,
+        'snapshot': str(snapshot.version) if snapshot.version else None,
+    }
+
+
+class VersionBroadcaster:
+    """Pushes version changes to every connected event-stream client.
+
+    One background task polls the versions (a few stat calls) every
+    `interval` seconds. All subscribers wait on the same future, which is
+    resolved and replaced on each change, so an idle connection costs one
+    suspended coroutine rather than a queue or a poll of its own.
+
+    While anyone is subscribed, the poll also runs `refresh` (rebuilding an
+    expired upcoming snapshot by default) in the default executor, one run
+    at a time, so versions that only move on demand still change for
+    clients that rely on the stream instead of polling.
+
+    Event ids are a hash of the versions, so a client reconnecting with
+    Last-Event-ID to another worker is recognized as up to date when the
+    model and dataset (shared files) match. The snapshot version is a
+    per-process counter, so across workers it can differ and trigger one
+    extra refetch of the upcoming list.
+    """
+
+    def __init__(self, versions: Callable[[], Dict] = current_versions,
+                 refresh: Optional[Callable[[], None]] = refresh_snapshot,
+                 interval: float = 2.0, heartbeat: float = 15.0):
+        self.versions = versions
+        self.refresh = refresh
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self.state: Dict = {}
+        self.subscribers = 0
+        self._changed: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refreshing: Optional[asyncio.Future] = None
+
+    @property
+    def event_id(self) -> str:
+        return hashlib.sha1(json.dumps(self.state, sort_keys=True).encode()).hexdigest()[:12]
+
+    def _ensure_started(self):
+        if self._task is None or self._task.done():
+            self.state = self.versions()
+            self._changed = asyncio.get_running_loop().create_future()
+            self._task = asyncio.create_task(self._poll())
+
+    async def _poll(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            if self.refresh and self.subscribers and (self._refreshing is None or self._refreshing.done()):
+                self._refreshing = asyncio.get_running_loop().run_in_executor(None, self.refresh)
+            try:
+                self.check()
+            except Exception as e:
+                print(f"Version check failed: {e}")
+
+    def check(self) -> bool:
+        """Compare versions now and wake subscribers if any changed"""
+        versions = self.versions()
+        if versions == self.state:
+            return False
+
+        self.state = versions
+        waiting, self._changed = self._changed, asyncio.get_running_loop().create_future()
+        waiting.set_result(None)
+        return True
+
+    def _event(self, changed) -> str:
+        data = json.dumps({'id': self.event_id, 'versions': self.state, 'changed': changed})
+        return f"id: {self.event_id}\nevent: versions\ndata: {data}\n\n"
+
+    async def stream(self, last_event_id: Optional[str] = None) -> AsyncIterator[str]:
+        """Server-sent events: the current versions, then one event per change"""
+        self._ensure_started()
+        self.subscribers += 1
+        try:
+            # Versions this client last received; a reconnecting client that
+            # saw the current ones gets nothing new
+            sent = self.state if last_event_id == self.event_id else None
+            yield "retry: 5000\n\n"
+
+            while True:
+                # Compared before every wait, so changes made while this
+                # client was suspended at a yield are not lost
+                if self.state != sent:
+                    changed = [name for name, version in self.state.items()
+                               if sent is None or sent.get(name) != version]
+                    sent = self.state
+                    yield self._event(changed)
+                    continue
+
+                try:
+                    await asyncio.wait_for(asyncio.shield(self._changed), self.heartbeat)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            self.subscribers -= 1
+
+
+broadcaster = VersionBroadcaster()
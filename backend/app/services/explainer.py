@@ -0,0 +1,116 @@
+import pandas as pd
+import numpy as np
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+from .model_trainer import EarningsPredictor
+from .model_registry import registry
+from .shared_store import file_version
+
+# Raw input each engineered feature is derived from
+FEATURE_INPUTS = {
+    'iv_proxy': 'iv_proxy', 'iv_proxy_log': 'iv_proxy', 'realized_vol_log': 'iv_proxy', 'vol_ratio': 'iv_proxy',
+    'momentum_20d': 'momentum_20d', 'momentum_20d_abs': 'momentum_20d', 'momentum_20d_sign': 'momentum_20d',
+    'beta_market': 'beta_market', 'beta_deviation': 'beta_market', 'beta_squared': 'beta_market',
+    'price_log': 'price',
+    'day_of_week': 'date', 'month': 'date', 'quarter': 'date',
+    'sector_tech': 'sector', 'sector_finance': 'sector', 'sector_healthcare': 'sector',
+    'spy_realized_vol_20d': 'market', 'spy_momentum_20d': 'market', 'sector_return_20d': 'market',
+}
+
+
+class Explainer:
+    """Per-feature contributions for batches of predictions.
+
+    Uses LightGBM's native contribution output (pred_contrib, TreeSHAP).
+    With the lightgbm backend the registry's loaded model is shared; with
+    the compiled backend, which has no contributions, the LightGBM model is
+    loaded here, so explanations need LightGBM installed either way.
+    Contributions are cached per feature row; only rows not seen before for
+    the current model version go to the model, in a single call.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._predictor = None
+        self._model = None
+        self._version = None
+        self._importances: Dict[str, int] = {}
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _ensure_model(self) -> EarningsPredictor:
+        if registry.backend == "lightgbm":
+            # Same loaded model as /predict rather than a second copy per worker
+            predictor = registry.get_predictor()
+            version = file_version(predictor.model_path)
+        else:
+            predictor = self._predictor or EarningsPredictor(backend="lightgbm")
+            if not os.path.exists(predictor.model_path):
+                raise FileNotFoundError(f"Model not found at {predictor.model_path}. Train model first.")
+            version = file_version(predictor.model_path)
+            if version != self._version:
+                predictor.load_model()
+
+        if version != self._version or predictor.model is not self._model:
+            self._predictor = predictor
+            self._model = predictor.model
+            self._version = version
+            self._importances = predictor.load_metadata().get('feature_importances') or predictor.feature_importances()
+            self._cache.clear()
+        return self._predictor
+
+    def explain(self, symbol, iv_proxy: np.ndarray, momentum_20d: np.ndarray,
+                beta_market: np.ndarray, prev_close=100) -> Dict:
+        """Contributions for predict_batch's inputs.
+
+        Returns the model `version`, its `feature_columns` and global
+        `feature_importances`, plus per row the `base_value`, the
+        `contributions` matrix (rows x features) and `predicted` values,
+        which equal base_value plus the row's contributions.
+        """
+        with self._lock:
+            predictor = self._ensure_model()
+            features = predictor.prepare_features(
+                predictor.batch_inputs(symbol, iv_proxy, momentum_20d, beta_market, prev_close)
+            )
+            X = np.ascontiguousarray(features[predictor.feature_columns].to_numpy(dtype=np.float64))
+            keys = [row.tobytes() for row in X]
+
+            missing = [key for key in dict.fromkeys(keys) if key not in self._cache]
+            if missing:
+                rows = np.frombuffer(b''.join(missing)).reshape(len(missing), -1)
+                contributions = predictor.model.predict(
+                    pd.DataFrame(rows, columns=predictor.feature_columns), pred_contrib=True
+                )
+                self._cache.update(zip(missing, contributions))
+
+            result = np.array([self._cache[key] for key in keys]).reshape(len(keys), -1)
+            for key in keys:
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+            return {
+                'version': self._version,
+                'feature_columns': list(predictor.feature_columns),
+                'feature_importances': self._importances,
+                'contributions': result[:, :-1],
+                'base_value': result[:, -1],
+                'predicted': result.sum(axis=1),
+                'computed': len(missing),
+            }
+
+
+def by_input(feature_columns: List[str], contributions: np.ndarray) -> Dict[str, np.ndarray]:
+    """Feature contributions summed per raw input (iv_proxy, momentum_20d, beta_market, price, date, sector, market)"""
+    grouped: Dict[str, np.ndarray] = {}
+    for j, feature in enumerate(feature_columns):
+        name = FEATURE_INPUTS.get(feature, feature)
+        grouped[name] = grouped.get(name, 0) + contributions[:, j]
+    return grouped
+
+
+explainer = Explainer()
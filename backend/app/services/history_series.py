@@ -0,0 +1,163 @@
+import pandas as pd
+import numpy as np
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .dataset_store import DatasetStore, dataset_store
+
+AGGREGATE_PERIODS = {'quarter': 'Q', 'year': 'Y'}
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling of a series sorted by x.
+
+    Returns the positions of at most `threshold` points, always keeping the
+    first and last. Each bucket keeps the point forming the largest triangle
+    with the previously kept point and the mean of the next bucket, so spikes
+    survive where plain striding would drop them.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64)
+    y = np.nan_to_num(y.astype(np.float64))
+
+    # Interior points split into threshold - 2 buckets
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    starts, ends = edges[:-1], edges[1:]
+
+    # Mean of each following bucket (the last interior bucket looks at the final point)
+    csum_x = np.concatenate(([0.0], np.cumsum(x)))
+    csum_y = np.concatenate(([0.0], np.cumsum(y)))
+    next_starts = np.append(starts[1:], n - 1)
+    next_ends = np.append(ends[1:], n)
+    counts = next_ends - next_starts
+    mean_x = (csum_x[next_ends] - csum_x[next_starts]) / counts
+    mean_y = (csum_y[next_ends] - csum_y[next_starts]) / counts
+
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    # Each bucket depends on the point kept in the previous one; the points
+    # within a bucket are scored together
+    a = 0
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        area = np.abs(
+            (x[a] - mean_x[i]) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (mean_y[i] - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def period_aggregates(history: pd.DataFrame, period: str) -> pd.DataFrame:
+    """Per-quarter or per-year means of a date-sorted symbol history"""
+    periods = history['earnings_date'].dt.to_period(AGGREGATE_PERIODS[period])
+    grouped = pd.DataFrame({
+        'gap': history['overnight_gap_pct'].to_numpy(),
+        'abs_gap': np.abs(history['overnight_gap_pct'].to_numpy()),
+        'iv_proxy': history['iv_proxy'].to_numpy(),
+        'realized_vol': history['five_day_realized_vol'].to_numpy(),
+    }).groupby(periods.to_numpy(), sort=True)
+
+    means = grouped.mean()
+    return pd.DataFrame({
+        'period': means.index.astype(str),
+        'start_date': means.index.to_timestamp(),
+        'events': grouped.size().to_numpy(),
+        'mean_gap_pct': means['gap'].to_numpy(),
+        'mean_abs_gap_pct': means['abs_gap'].to_numpy(),
+        'mean_iv_proxy': means['iv_proxy'].to_numpy(),
+        'mean_realized_vol': means['realized_vol'].to_numpy(),
+    })
+
+
+def summarize(history: pd.DataFrame) -> Dict:
+    """Whole-history means, matching the columns of period_aggregates"""
+    gap = history['overnight_gap_pct'].to_numpy()
+    return {
+        'period': 'all',
+        'start_date': history['earnings_date'].iloc[0],
+        'events': len(history),
+        'mean_gap_pct': float(gap.mean()),
+        'mean_abs_gap_pct': float(np.abs(gap).mean()),
+        'mean_iv_proxy': float(history['iv_proxy'].mean()),
+        'mean_realized_vol': float(history['five_day_realized_vol'].mean()),
+    }
+
+
+class HistorySeries:
+    """Chart-ready per-symbol histories, cached per dataset version.
+
+    Downsampled series and aggregates are computed once per (symbol, points,
+    aggregate) and dropped as soon as the dataset version changes.
+    """
+
+    def __init__(self, store: Optional[DatasetStore] = None, max_entries: int = 1024):
+        self.store = store or dataset_store
+        self.max_entries = max_entries
+        self._version = None
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str, points: Optional[int] = None,
+            aggregate: Optional[str] = None) -> Optional[Dict]:
+        """History for `symbol` oldest first, or None if the symbol has no data.
+
+        Returns a dict with the (possibly downsampled) `rows`, the number of
+        `total_events`, a whole-history `summary` and, when requested,
+        per-period `aggregates`.
+        """
+        if aggregate is not None and aggregate not in AGGREGATE_PERIODS:
+            raise ValueError(f"Unknown aggregate '{aggregate}'. Choose from {tuple(AGGREGATE_PERIODS)}")
+
+        df = self.store.get_frame()
+        key = (symbol.upper(), points, aggregate)
+
+        with self._lock:
+            if self.store.version != self._version:
+                self._cache.clear()
+                self._version = self.store.version
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._build(df, *key)
+
+        with self._lock:
+            self._cache[key] = result
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    def _build(self, df: pd.DataFrame, symbol: str, points: Optional[int],
+               aggregate: Optional[str]) -> Optional[Dict]:
+        codes = df['symbol'].cat.categories.get_indexer([symbol])
+        if codes[0] < 0:
+            return None
+
+        positions = np.flatnonzero(df['symbol'].cat.codes.to_numpy() == codes[0])
+        history = df.iloc[positions].sort_values('earnings_date', kind='mergesort').reset_index(drop=True)
+        if history.empty:
+            return None
+
+        rows = history
+        if points is not None and points < len(history):
+            x = history['earnings_date'].to_numpy(dtype='datetime64[D]').astype(np.int64)
+            y = np.abs(history['overnight_gap_pct'].to_numpy())
+            rows = history.iloc[lttb_indices(x, y, points)]
+
+        return {
+            'rows': rows,
+            'total_events': len(history),
+            'summary': summarize(history),
+            'aggregates': period_aggregates(history, aggregate) if aggregate else None,
+        }
+
+
+history_series = HistorySeries()
@@ -0,0 +1,120 @@
+import pandas as pd
+import numpy as np
+import threading
+import time
+from typing import Optional
+
+from . import providers
+from .providers import MarketDataProvider
+
+# Benchmark ETF per sector; 'other' falls back to the market itself
+SECTOR_ETFS = {'tech': 'XLK', 'finance': 'XLF', 'healthcare': 'XLV', 'other': 'SPY'}
+
+REGIME_COLUMNS = ['spy_realized_vol_20d', 'spy_momentum_20d', 'sector_return_20d']
+
+# Market values older than this before an event are treated as missing
+MAX_STALENESS = pd.Timedelta(days=10)
+
+
+def build_market_panel(close: pd.DataFrame) -> pd.DataFrame:
+    """Daily regime series from wide closes (dates x tickers), each computed once over the whole history"""
+    close = close.sort_index().ffill()
+    spy = close['SPY']
+    returns_20d = (close / close.shift(20) - 1) * 100
+
+    panel = pd.DataFrame({
+        'spy_realized_vol_20d': np.log(spy / spy.shift(1)).rolling(20).std() * np.sqrt(252) * 100,
+        'spy_momentum_20d': returns_20d['SPY'],
+    })
+    for ticker in sorted(set(SECTOR_ETFS.values())):
+        panel[f'return_20d_{ticker}'] = returns_20d[ticker] if ticker in returns_20d else np.nan
+
+    panel.index = pd.DatetimeIndex(panel.index).tz_localize(None).normalize().as_unit('ns')
+    panel.index.name = 'date'
+    return panel.dropna(how='all')
+
+
+def attach_regime_features(events: pd.DataFrame, sectors: np.ndarray, panel: pd.DataFrame) -> pd.DataFrame:
+    """`events` with REGIME_COLUMNS as of the last market close before each earnings_date.
+
+    One as-of merge for the market-wide columns and one, grouped by
+    sector, for the sector ETF return; row order of `events` is kept.
+    """
+    out = events.copy()
+    if panel.empty:
+        for column in REGIME_COLUMNS:
+            out[column] = np.nan
+        return out
+
+    left = pd.DataFrame({
+        'earnings_date': pd.to_datetime(events['earnings_date']).to_numpy(dtype='datetime64[ns]'),
+        'etf': pd.Series(sectors).map(SECTOR_ETFS).fillna('SPY').to_numpy(),
+        'row': np.arange(len(events)),
+    }).sort_values('earnings_date', kind='mergesort')
+
+    panel = panel.set_axis(pd.DatetimeIndex(panel.index).as_unit('ns'))
+    panel.index.name = 'date'
+    market = panel[['spy_realized_vol_20d', 'spy_momentum_20d']].reset_index()
+    etf_columns = [column for column in panel.columns if column.startswith('return_20d_')]
+    sector = panel[etf_columns].rename(columns=lambda c: c[len('return_20d_'):]).stack().rename('sector_return_20d')
+    sector = sector.reset_index().rename(columns={'level_1': 'etf'}).sort_values('date', kind='mergesort')
+
+    # allow_exact_matches=False: an event on day D only sees closes up to D-1
+    joined = pd.merge_asof(left, market, left_on='earnings_date', right_on='date',
+                           allow_exact_matches=False, tolerance=MAX_STALENESS)
+    joined = pd.merge_asof(joined.drop(columns='date'), sector, left_on='earnings_date', right_on='date',
+                           by='etf', allow_exact_matches=False, tolerance=MAX_STALENESS)
+
+    joined = joined.sort_values('row')
+    for column in REGIME_COLUMNS:
+        out[column] = joined[column].to_numpy()
+    return out
+
+
+class MarketPanel:
+    """Process-wide market regime panel, fetched in one bulk call and rebuilt every `ttl` seconds.
+
+    A failed fetch yields an empty panel, so regime features become missing
+    values rather than failing predictions; it is retried after
+    `retry_after` seconds instead of being kept for the full `ttl`.
+    """
+
+    def __init__(self, period: str = "10y", ttl: float = 3600, retry_after: float = 60,
+                 provider: Optional[MarketDataProvider] = None):
+        self.period = period
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.provider = provider
+        self._panel = None
+        self._built_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self) -> pd.DataFrame:
+        with self._lock:
+            if self._panel is None or time.monotonic() - self._built_at > self._max_age():
+                self._panel = self._build()
+                self._built_at = time.monotonic()
+            return self._panel
+
+    def _max_age(self) -> float:
+        return self.retry_after if self._panel is not None and self._panel.empty else self.ttl
+
+    def _build(self) -> pd.DataFrame:
+        provider = self.provider or providers.provider
+        tickers = sorted(set(SECTOR_ETFS.values()))
+        try:
+            close = provider.bulk_history(tickers, self.period)['Close']
+        except Exception as e:
+            print(f"Error fetching market regime data: {e}")
+            return pd.DataFrame(columns=REGIME_COLUMNS)
+
+        if isinstance(close, pd.Series) or 'SPY' not in close:
+            print("Market regime data is missing SPY")
+            return pd.DataFrame(columns=REGIME_COLUMNS)
+
+        panel = build_market_panel(close)
+        print(f"Built market regime panel with {len(panel)} days")
+        return panel
+
+
+market_panel = MarketPanel()
@@ -0,0 +1,60 @@
+import os
+import threading
+from typing import Optional
+
+from .model_trainer import EarningsPredictor, MODEL_BACKENDS
+
+
+class ModelRegistry:
+    """Keeps one loaded EarningsPredictor per process.
+
+    The inference backend is chosen per deployment with the MODEL_BACKEND
+    environment variable ("lightgbm" or "compiled"). The predictor is
+    reloaded only when the model artifact on disk changes.
+    """
+
+    def __init__(self, backend: Optional[str] = None):
+        self.backend = backend or os.getenv("MODEL_BACKEND", "lightgbm")
+        if self.backend not in MODEL_BACKENDS:
+            raise ValueError(f"Unknown model backend '{self.backend}'. Choose from {MODEL_BACKENDS}")
+
+        self._predictor = None
+        self._loaded_mtime = None
+        self._lock = threading.Lock()
+
+    def _artifact_path(self, predictor: EarningsPredictor) -> str:
+        if self.backend == "compiled":
+            return predictor.compiled_path
+        return predictor.model_path
+
+    def artifact_path(self) -> str:
+        """Path of the model artifact this registry serves"""
+        return self._artifact_path(self._predictor or EarningsPredictor(backend=self.backend))
+
+    def get_predictor(self) -> EarningsPredictor:
+        """Return a loaded predictor, raising FileNotFoundError if no model is trained"""
+        with self._lock:
+            return self._get_predictor()
+
+    def _get_predictor(self) -> EarningsPredictor:
+        predictor = self._predictor or EarningsPredictor(backend=self.backend)
+        path = self._artifact_path(predictor)
+
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Model not found at {path}. Train model first.")
+
+        mtime = os.path.getmtime(path)
+        if self._predictor is None or mtime != self._loaded_mtime:
+            predictor.load_model()
+            self._predictor = predictor
+            self._loaded_mtime = mtime
+
+        return self._predictor
+
+    def invalidate(self):
+        """Drop the cached predictor so the next request reloads it"""
+        self._predictor = None
+        self._loaded_mtime = None
+
+
+registry = ModelRegistry()
@@ -1,17 +1,95 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score, TimeSeriesSplit
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from lightgbm import LGBMRegressor
-import joblib
+import json
 import os
+import time
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from .compiled_model import CompiledTreeEnsemble
+from .shared_store import SharedArrayStore, file_version
+from .market_regime import REGIME_COLUMNS, attach_regime_features, market_panel
+
+if TYPE_CHECKING:
+    from lightgbm import LGBMRegressor
+
+# Inference backends an EarningsPredictor can serve predictions from
+MODEL_BACKENDS = ("lightgbm", "compiled")
+
+FEATURE_COLUMNS = [
+    'iv_proxy', 'iv_proxy_log', 'realized_vol_log', 'vol_ratio',
+    'momentum_20d', 'momentum_20d_abs', 'momentum_20d_sign',
+    'beta_market', 'beta_deviation', 'beta_squared',
+    'price_log', 'day_of_week', 'month', 'quarter',
+    'sector_tech', 'sector_finance', 'sector_healthcare'
+] + REGIME_COLUMNS
+
+# Sector membership used for the sector features (simplified)
+SECTOR_SYMBOLS = {
+    'tech': ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'TSLA', 'NVDA', 'NFLX', 'CRM', 'UBER', 'ORCL', 'ADBE', 'INTC', 'AMD', 'PYPL', 'SNOW', 'PLTR', 'ROKU', 'ZM', 'SQ'],
+    'finance': ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'BLK', 'AXP', 'V', 'MA'],
+    'healthcare': ['JNJ', 'PFE', 'UNH', 'MRNA', 'ABBV', 'TMO', 'DHR', 'BMY', 'MRK', 'LLY'],
+}
+
+def drop_incomplete(features_df: pd.DataFrame, columns=None) -> pd.DataFrame:
+    """Rows with no missing values in `columns` (all by default).
+    
+    Market regime values are exempt: they are missing for events outside the
+    market panel or when it could not be fetched, and LightGBM handles that.
+    """
+    columns = features_df.columns if columns is None else columns
+    return features_df.dropna(subset=[column for column in columns if column not in REGIME_COLUMNS])
+
+def event_keys(features_df: pd.DataFrame) -> np.ndarray:
+    """uint64 identity of each (symbol, earnings_date) event"""
+    return pd.util.hash_pandas_object(pd.DataFrame({
+        'symbol': features_df['symbol'].astype(str).to_numpy(),
+        'earnings_date': pd.to_datetime(features_df['earnings_date']).dt.normalize().to_numpy(),
+    }), index=False).to_numpy()
+
+def sector_of(symbols) -> np.ndarray:
+    """Sector label per symbol ('tech', 'finance', 'healthcare' or 'other')"""
+    symbols = pd.Series(symbols)
+    sectors = np.full(len(symbols), 'other', dtype=object)
+    for sector, members in SECTOR_SYMBOLS.items():
+        sectors[symbols.isin(members).to_numpy()] = sector
+    return sectors
+
+def _row_sequence(rows: np.ndarray, batch_size: int):
+    """lightgbm.Sequence reading (memory-mapped) rows one batch at a time"""
+    import lightgbm as lgb
+    
+    class RowSequence(lgb.Sequence):
+        def __init__(self):
+            self.batch_size = batch_size
+        
+        def __len__(self):
+            return len(rows)
+        
+        def __getitem__(self, idx):
+            return np.asarray(rows[idx], dtype=np.float64)
+    
+    return RowSequence()
+
+def _predict_in_chunks(model, rows: np.ndarray, start: int, end: int, chunksize: int) -> np.ndarray:
+    return np.concatenate([
+        model.predict(np.asarray(rows[i:min(i + chunksize, end)], dtype=np.float64))
+        for i in range(start, end, chunksize)
+    ])
 
 class EarningsPredictor:
-    def __init__(self):
+    def __init__(self, backend: str = "lightgbm"):
+        if backend not in MODEL_BACKENDS:
+            raise ValueError(f"Unknown model backend '{backend}'. Choose from {MODEL_BACKENDS}")
+        
+        self.backend = backend
         self.model = None
         self.feature_columns = None
+        # event_keys of the rows the model has been trained on
+        self.trained_events = None
         self.model_path = "backend/models/earnings_predictor.joblib"
+        self.compiled_path = "backend/models/earnings_predictor.npz"
+        self.metadata_path = "backend/models/earnings_predictor.json"
         os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
     
     def prepare_features(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -45,18 +123,37 @@ class EarningsPredictor:
         features_df['quarter'] = features_df['earnings_date'].dt.quarter
         
         # Sector encoding (simplified)
-        tech_symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'META', 'TSLA', 'NVDA', 'NFLX', 'CRM', 'UBER', 'ORCL', 'ADBE', 'INTC', 'AMD', 'PYPL', 'SNOW', 'PLTR', 'ROKU', 'ZM', 'SQ']
-        finance_symbols = ['JPM', 'BAC', 'WFC', 'GS', 'MS', 'C', 'BLK', 'AXP', 'V', 'MA']
-        healthcare_symbols = ['JNJ', 'PFE', 'UNH', 'MRNA', 'ABBV', 'TMO', 'DHR', 'BMY', 'MRK', 'LLY']
+        features_df['sector_tech'] = features_df['symbol'].isin(SECTOR_SYMBOLS['tech']).astype(int)
+        features_df['sector_finance'] = features_df['symbol'].isin(SECTOR_SYMBOLS['finance']).astype(int)
+        features_df['sector_healthcare'] = features_df['symbol'].isin(SECTOR_SYMBOLS['healthcare']).astype(int)
         
-        features_df['sector_tech'] = features_df['symbol'].isin(tech_symbols).astype(int)
-        features_df['sector_finance'] = features_df['symbol'].isin(finance_symbols).astype(int)
-        features_df['sector_healthcare'] = features_df['symbol'].isin(healthcare_symbols).astype(int)
+        # Market regime as of the last close before each event, unless the dataset already has it
+        if not set(REGIME_COLUMNS) <= set(features_df.columns):
+            features_df = attach_regime_features(features_df, sector_of(features_df['symbol']), market_panel.get())
         
         return features_df
     
-    def train_model(self, data_path: str = "backend/data/historical_earnings.csv"):
+    def build_model(self) -> "LGBMRegressor":
+        """Untrained regressor with the production hyperparameters"""
+        from lightgbm import LGBMRegressor
+        
+        return LGBMRegressor(
+            n_estimators=200,
+            learning_rate=0.1,
+            max_depth=6,
+            num_leaves=31,
+            subsample=0.8,
+            colsample_bytree=0.8,
+            random_state=42,
+            verbose=-1
+        )
+    
+    def train_model(self, data_path: str = "backend/data/historical_earnings.csv", reason: str = "requested"):
         """Train the earnings prediction model"""
+        # Training-only dependencies stay out of the serving import path
+        from sklearn.model_selection import cross_val_score, TimeSeriesSplit
+        from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+        
         print("Loading training data...")
         df = pd.read_csv(data_path)
         print(f"Loaded {len(df)} records")
@@ -68,35 +165,21 @@ class EarningsPredictor:
         features_df = self.prepare_features(df)
         
         # Remove rows with missing values
-        features_df = features_df.dropna()
+        features_df = drop_incomplete(features_df)
         print(f"Training on {len(features_df)} records after removing NaN values")
         
         # Define feature columns
-        self.feature_columns = [
-            'iv_proxy', 'iv_proxy_log', 'realized_vol_log', 'vol_ratio',
-            'momentum_20d', 'momentum_20d_abs', 'momentum_20d_sign',
-            'beta_market', 'beta_deviation', 'beta_squared',
-            'price_log', 'day_of_week', 'month', 'quarter',
-            'sector_tech', 'sector_finance', 'sector_healthcare'
-        ]
+        self.feature_columns = list(FEATURE_COLUMNS)
         
         X = features_df[self.feature_columns]
         y = features_df['target']
+        self.trained_events = event_keys(features_df)
         
         # Time series split for validation
         tscv = TimeSeriesSplit(n_splits=3)
         
         # Train model
-        self.model = LGBMRegressor(
-            n_estimators=200,
-            learning_rate=0.1,
-            max_depth=6,
-            num_leaves=31,
-            subsample=0.8,
-            colsample_bytree=0.8,
-            random_state=42,
-            verbose=-1
-        )
+        self.model = self.build_model()
         
         # Cross-validation
         print("Performing cross-validation...")
@@ -122,34 +205,344 @@ class EarningsPredictor:
         rmse = np.sqrt(mean_squared_error(y, y_pred))
         r2 = r2_score(y, y_pred)
         
-        print(f"\nFinal Model Performance:")
+        print("\nFinal Model Performance:")
+        print(f"MAE: {mae:.3f}%")
+        print(f"RMSE: {rmse:.3f}%")
+        print(f"R²: {r2:.3f}")
+        
+        performance = {'mae': float(mae), 'rmse': float(rmse), 'r2': float(r2), 'cv_mae': float(-cv_scores.mean())}
+        self._save_artifacts(performance, self._full_training_info(
+            len(features_df), features_df['earnings_date'].max(), performance, reason
+        ))
+        
+        return self.model
+    
+    def native_params(self) -> dict:
+        """build_model()'s hyperparameters for lightgbm.train, plus the number of rounds"""
+        params = self.build_model().get_params()
+        num_boost_round = params.pop('n_estimators')
+        for sklearn_only in ('class_weight', 'importance_type'):
+            params.pop(sklearn_only, None)
+        
+        # LightGBM accepts the remaining sklearn names as parameter aliases
+        params = {key: value for key, value in params.items() if value is not None}
+        params['objective'] = params.get('objective') or 'regression'
+        return {'params': params, 'num_boost_round': num_boost_round}
+    
+    def train_model_out_of_core(self, data_path: str = "backend/data/historical_earnings.csv",
+                                chunksize: int = 100_000, spill_dir: str = "backend/data/cache",
+                                reason: str = "requested"):
+        """Train without materializing the dataset as one DataFrame.
+        
+        The CSV is read in chunks; each chunk's features are appended as
+        float32 rows to a spill file on disk. LightGBM bins the memory-mapped
+        rows batch by batch into its native Dataset, and the CV folds are
+        subsets of that binned Dataset.
+        """
+        import lightgbm as lgb
+        import resource
+        import tempfile
+        from sklearn.model_selection import TimeSeriesSplit
+        
+        os.makedirs(spill_dir, exist_ok=True)
+        self.feature_columns = list(FEATURE_COLUMNS)
+        
+        with tempfile.TemporaryDirectory(dir=spill_dir) as tmp_dir:
+            features_path = os.path.join(tmp_dir, "features.f32")
+            targets = []
+            keys = []
+            n_rows = 0
+            trained_through = None
+            
+            print(f"Streaming training data from {data_path} in chunks of {chunksize}...")
+            with open(features_path, 'wb') as spill:
+                for chunk in pd.read_csv(data_path, chunksize=chunksize):
+                    features_df = self.prepare_features(chunk)
+                    features_df = drop_incomplete(features_df, self.feature_columns + ['target'])
+                    spill.write(features_df[self.feature_columns].to_numpy(dtype=np.float32).tobytes())
+                    targets.append(features_df['target'].to_numpy(dtype=np.float32))
+                    keys.append(event_keys(features_df))
+                    n_rows += len(features_df)
+                    if len(features_df):
+                        chunk_through = features_df['earnings_date'].max()
+                        trained_through = chunk_through if trained_through is None else max(trained_through, chunk_through)
+            
+            if n_rows == 0:
+                raise ValueError("No training data available. Run data_pipeline.py first.")
+            print(f"Training on {n_rows} records after removing NaN values")
+            
+            X = np.memmap(features_path, dtype=np.float32, mode='r', shape=(n_rows, len(self.feature_columns)))
+            y = np.concatenate(targets)
+            self.trained_events = np.concatenate(keys)
+            del targets, keys
+            
+            native = self.native_params()
+            params = native['params']
+            dataset = lgb.Dataset(
+                _row_sequence(X, chunksize), label=y, feature_name=self.feature_columns,
+                params=params, free_raw_data=True
+            ).construct()
+            
+            # Cross-validation on subsets of the binned Dataset
+            print("Performing cross-validation...")
+            fold_mae = []
+            for train_idx, valid_idx in TimeSeriesSplit(n_splits=3).split(np.empty((n_rows, 1))):
+                booster = lgb.train(params, dataset.subset(train_idx), num_boost_round=native['num_boost_round'])
+                predictions = _predict_in_chunks(booster, X, valid_idx[0], valid_idx[-1] + 1, chunksize)
+                fold_mae.append(np.abs(predictions - y[valid_idx]).mean())
+            fold_mae = np.array(fold_mae)
+            print(f"CV MAE: {fold_mae.mean():.3f} (+/- {fold_mae.std() * 2:.3f})")
+            
+            print("Training final model...")
+            self.model = lgb.train(params, dataset, num_boost_round=native['num_boost_round'])
+            
+            # Final evaluation, streamed over the spill file
+            y_pred = _predict_in_chunks(self.model, X, 0, n_rows, chunksize)
+            errors = y_pred - y
+            mae = float(np.abs(errors).mean())
+            rmse = float(np.sqrt((errors ** 2).mean()))
+            r2 = float(1 - (errors ** 2).sum() / ((y - y.mean()) ** 2).sum())
+            spill_mb = os.path.getsize(features_path) / 1024 ** 2
+            del X
+        
+        # ru_maxrss is in kilobytes on Linux
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        
+        print("\nFinal Model Performance:")
         print(f"MAE: {mae:.3f}%")
         print(f"RMSE: {rmse:.3f}%")
         print(f"R²: {r2:.3f}")
+        print(f"Peak memory: {peak_mb:.0f} MB (feature spill file {spill_mb:.0f} MB)")
+        
+        performance = {'mae': mae, 'rmse': rmse, 'r2': r2, 'cv_mae': float(fold_mae.mean())}
+        self._save_artifacts(performance, self._full_training_info(n_rows, trained_through, performance, reason))
+        
+        return self.model
+    
+    def update_model(self, data_path: str = "backend/data/historical_earnings.csv",
+                     rounds: int = 20, replay_rows: int = 1000, full_rebuild_days: int = 30,
+                     drift_threshold: float = 0.25, compare_full: bool = False):
+        """Continue boosting the saved model on events newer than it has seen.
+        
+        New rows are events (symbol, earnings_date) the model was not trained
+        on, whatever their date. They, plus the `replay_rows` most recent already-seen rows so a
+        handful of events cannot dominate, get `rounds` extra trees on top of
+        the existing booster. Falls back to a full train_model() when the last
+        full rebuild is older than `full_rebuild_days`, or when the current
+        model's MAE on the new rows exceeds the last full rebuild's CV MAE by
+        more than `drift_threshold`. With `compare_full`, a full rebuild is
+        also fitted in memory and its metrics stored next to the update's.
+        """
+        training = self.load_metadata().get('training') if os.path.exists(self.model_path) else None
+        if training is None:
+            print("No incremental lineage for the saved model, running a full rebuild")
+            return self.train_model(data_path, reason="no_lineage")
+        
+        last_full = datetime.fromisoformat(training['last_full_rebuild'])
+        if (datetime.now() - last_full).days >= full_rebuild_days:
+            print(f"Last full rebuild was {last_full:%Y-%m-%d}, running a scheduled full rebuild")
+            return self.train_model(data_path, reason="schedule")
+        
+        self._load_lightgbm_model()
+        
+        # Same row filter as train_model, so both train on the same population
+        features_df = drop_incomplete(self.prepare_features(pd.read_csv(data_path)))
+        features_df = features_df.sort_values('earnings_date', kind='mergesort')
+        keys = event_keys(features_df)
+        
+        if self.trained_events is not None:
+            seen = np.isin(keys, self.trained_events)
+        else:
+            # Models saved before trained events were recorded
+            seen = (features_df['earnings_date'] <= pd.Timestamp(training['trained_through'])).to_numpy()
+        new_df = features_df[~seen]
+        if new_df.empty:
+            print("No events the model has not been trained on, model is up to date")
+            return self.model
+        
+        X_new, y_new = new_df[self.feature_columns], new_df['target'].to_numpy()
+        prior_mae = float(np.abs(self.model.predict(X_new) - y_new).mean())
+        reference = training['full_rebuild_performance']
+        reference_mae = reference.get('cv_mae', reference['mae'])
+        drift = prior_mae / reference_mae - 1
+        print(f"{len(new_df)} new events; current model MAE on them {prior_mae:.3f}% "
+              f"vs {reference_mae:.3f}% at last full rebuild ({drift:+.0%})")
+        
+        if drift > drift_threshold:
+            print(f"Drift above {drift_threshold:.0%}, running a full rebuild")
+            return self.train_model(data_path, reason="drift")
+        
+        train_df = pd.concat([features_df[seen].tail(replay_rows), new_df])
+        print(f"Boosting {rounds} more rounds on {len(new_df)} new + {len(train_df) - len(new_df)} replayed events...")
+        started = time.perf_counter()
+        self.model = self._continue_boosting(train_df[self.feature_columns], train_df['target'], rounds)
+        update_seconds = time.perf_counter() - started
+        self.trained_events = np.concatenate([self.trained_events, keys[~seen]]) \
+            if self.trained_events is not None else keys
+        
+        X, y = features_df[self.feature_columns], features_df['target'].to_numpy()
+        errors = self.model.predict(X) - y
+        performance = {
+            'mae': float(np.abs(errors).mean()),
+            'rmse': float(np.sqrt((errors ** 2).mean())),
+            'r2': float(1 - (errors ** 2).sum() / ((y - y.mean()) ** 2).sum())
+        }
+        update = {
+            'mode': 'incremental',
+            'fit_seconds': update_seconds,
+            'new_rows': len(new_df),
+            'replay_rows': len(train_df) - len(new_df),
+            'rounds': rounds,
+            'drift': drift,
+            'prior_mae_new_rows': prior_mae,
+            'updated_mae_new_rows': float(np.abs(self.model.predict(X_new) - y_new).mean()),
+            'mae_all_rows': performance['mae']
+        }
+        
+        if compare_full:
+            print("Fitting a full rebuild for comparison...")
+            full_started = time.perf_counter()
+            full_model = self.build_model().fit(X, y)
+            update['full_rebuild_comparison'] = {
+                'fit_seconds': time.perf_counter() - full_started,
+                'mae_new_rows': float(np.abs(full_model.predict(X_new) - y_new).mean()),
+                'mae_all_rows': float(np.abs(full_model.predict(X) - y).mean()),
+                'num_trees': full_model.booster_.num_trees()
+            }
+        
+        training = {
+            **training,
+            'mode': 'incremental',
+            'rows': len(features_df),
+            'trained_through': max(pd.Timestamp(training['trained_through']),
+                                   new_df['earnings_date'].max()).date().isoformat(),
+            'incremental_updates': training.get('incremental_updates', 0) + 1,
+            'num_trees': self._booster().num_trees()
+        }
+        
+        print(f"Incremental update: MAE on new events {prior_mae:.3f}% -> {update['updated_mae_new_rows']:.3f}% "
+              f"in {update_seconds:.1f}s")
+        self._save_artifacts(performance, training, update)
+        
+        return self.model
+    
+    def feature_importances(self) -> dict:
+        """Split-count importance per feature, as the sklearn wrapper's feature_importances_ reports it"""
+        importances = getattr(self.model, 'feature_importances_', None)
+        if importances is None:
+            importances = self._booster().feature_importance()
+        return {feature: int(value) for feature, value in zip(self.feature_columns, importances)}
+    
+    def _booster(self):
+        """Native LightGBM booster of the sklearn wrapper or out-of-core model"""
+        return getattr(self.model, 'booster_', self.model)
+    
+    def _continue_boosting(self, X: pd.DataFrame, y: pd.Series, rounds: int):
+        """Model with `rounds` trees fitted on (X, y) appended to the current ones"""
+        import lightgbm as lgb
+        
+        if isinstance(self.model, lgb.LGBMRegressor):
+            model = self.build_model().set_params(n_estimators=rounds)
+            return model.fit(X, y, init_model=self.model.booster_)
+        
+        params = self.native_params()['params']
+        return lgb.train(params, lgb.Dataset(X, label=y, params=params),
+                         num_boost_round=rounds, init_model=self.model)
+    
+    def _full_training_info(self, rows: int, trained_through, performance: dict, reason: str) -> dict:
+        """Training lineage recorded in the metadata after a full rebuild"""
+        now = datetime.now().isoformat()
+        return {
+            'mode': 'full',
+            'rebuild_reason': reason,
+            'rows': int(rows),
+            'trained_through': pd.Timestamp(trained_through).date().isoformat(),
+            'last_full_rebuild': now,
+            'full_rebuild_performance': performance,
+            'incremental_updates': 0,
+            'num_trees': self._booster().num_trees()
+        }
+    
+    def _save_artifacts(self, performance: dict, training: Optional[dict] = None, update: Optional[dict] = None):
+        """Write the joblib model, metadata sidecar and compiled model, then publish"""
+        import joblib
         
         # Save model
         print(f"Saving model to {self.model_path}")
-        joblib.dump({
-            'model': self.model,
+        metadata = {
             'feature_columns': self.feature_columns,
             'training_date': datetime.now().isoformat(),
-            'performance': {'mae': mae, 'rmse': rmse, 'r2': r2}
-        }, self.model_path)
+            'performance': performance,
+            'feature_importances': self.feature_importances(),
+            'training': training
+        }
+        if update is not None:
+            metadata['update'] = update
+        joblib.dump({'model': self.model, 'trained_events': self.trained_events, **metadata}, self.model_path)
         
-        return self.model
+        # Metadata sidecar lets status checks skip unpickling LightGBM
+        with open(self.metadata_path, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        
+        # Compiled copy for the dependency-light inference backend
+        print(f"Saving compiled model to {self.compiled_path}")
+        compiled = CompiledTreeEnsemble.from_lightgbm(self.model)
+        compiled.save(self.compiled_path)
+        
+        # Publish for serving workers to memory-map
+        store = SharedArrayStore()
+        store.publish("model", file_version(self.compiled_path), *compiled.to_arrays())
+        store.prune("model")
     
     def load_model(self):
-        """Load trained model"""
+        """Load trained model for the configured backend"""
+        if self.backend == "compiled":
+            return self._load_compiled_model()
+        
+        return self._load_lightgbm_model()
+    
+    def _load_lightgbm_model(self):
         if not os.path.exists(self.model_path):
             raise FileNotFoundError(f"Model not found at {self.model_path}. Train model first.")
         
+        import joblib
         model_data = joblib.load(self.model_path)
         self.model = model_data['model']
         self.feature_columns = model_data['feature_columns']
+        self.trained_events = model_data.get('trained_events')
         
         print(f"Model loaded from {self.model_path}")
         return self.model
     
+    def load_metadata(self) -> dict:
+        """Training date, performance and feature list without loading the model"""
+        if os.path.exists(self.metadata_path):
+            with open(self.metadata_path) as f:
+                return json.load(f)
+        
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(f"Model not found at {self.model_path}. Train model first.")
+        
+        # Models trained before the sidecar existed
+        import joblib
+        model_data = joblib.load(self.model_path)
+        return {key: value for key, value in model_data.items() if key not in ('model', 'trained_events')}
+    
+    def _load_compiled_model(self):
+        """Attach to the shared, memory-mapped copy of the compiled model"""
+        if not os.path.exists(self.compiled_path):
+            raise FileNotFoundError(f"Compiled model not found at {self.compiled_path}. Train model first.")
+        
+        version = file_version(self.compiled_path)
+        arrays, meta, _ = SharedArrayStore().ensure(
+            "model", version, lambda: CompiledTreeEnsemble.load(self.compiled_path).to_arrays()
+        )
+        self.model = CompiledTreeEnsemble.from_arrays(arrays, meta)
+        self.feature_columns = self.model.feature_names
+        
+        print(f"Compiled model {version} attached from shared store")
+        return self.model
+    
     def predict(self, features: pd.DataFrame) -> np.ndarray:
         """Make predictions on new data"""
         if self.model is None:
@@ -162,22 +555,41 @@ class EarningsPredictor:
         predictions = self.model.predict(X)
         return predictions
     
+    def predict_batch(self, symbol, iv_proxy: np.ndarray, momentum_20d: np.ndarray,
+                      beta_market: np.ndarray, prev_close=100) -> np.ndarray:
+        """Predictions over arrays of input values, in one model call.
+        
+        `symbol` and `prev_close` may be scalars or arrays matching `iv_proxy`.
+        """
+        return self.predict(self.batch_inputs(symbol, iv_proxy, momentum_20d, beta_market, prev_close))
+    
+    def batch_inputs(self, symbol, iv_proxy: np.ndarray, momentum_20d: np.ndarray,
+                     beta_market: np.ndarray, prev_close=100) -> pd.DataFrame:
+        """Dataset-shaped rows for predict_batch's inputs, before prepare_features"""
+        iv_proxy = np.asarray(iv_proxy, dtype=float)
+        n = len(iv_proxy)
+        prev_close = np.broadcast_to(np.asarray(prev_close, dtype=float), n)
+        
+        # Same dummy rows as predict_single, built column-wise
+        batch_data = pd.DataFrame({
+            'symbol': np.broadcast_to(np.asarray(symbol), n),
+            'earnings_date': np.full(n, datetime.now().date()),
+            'prev_close': prev_close,
+            'post_open': prev_close,  # Dummy value
+            'overnight_gap_pct': np.zeros(n),  # Dummy value
+            'five_day_realized_vol': iv_proxy * 0.8,  # Estimate
+            'iv_proxy': iv_proxy,
+            'momentum_20d': np.asarray(momentum_20d, dtype=float),
+            'beta_market': np.asarray(beta_market, dtype=float),
+            'past_surprise': np.full(n, None)
+        })
+        
+        return batch_data
+    
     def predict_single(self, symbol: str, iv_proxy: float, momentum_20d: float = 0, 
                       beta_market: float = 1.0, prev_close: float = 100) -> float:
         """Make prediction for a single stock"""
-        # Create dummy data for prediction
-        dummy_data = pd.DataFrame({
-            'symbol': [symbol],
-            'earnings_date': [datetime.now().date()],
-            'prev_close': [prev_close],
-            'post_open': [prev_close],  # Dummy value
-            'overnight_gap_pct': [0],  # Dummy value
-            'five_day_realized_vol': [iv_proxy * 0.8],  # Estimate
-            'iv_proxy': [iv_proxy],
-            'momentum_20d': [momentum_20d],
-            'beta_market': [beta_market],
-            'past_surprise': [None]
-        })
-        
-        prediction = self.predict(dummy_data)[0]
+        prediction = self.predict_batch(
+            symbol, [iv_proxy], [momentum_20d], [beta_market], prev_close
+        )[0]
         return prediction
\ No newline at end of file
@@ -0,0 +1,242 @@
+import pandas as pd
+import numpy as np
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Hashable, List, Optional
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight wait for that result instead of starting their own.
+    Nothing is cached once the call completes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable):
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+        return future.result()
+
+
+class MarketDataProvider:
+    """Upstream source of prices, quotes and earnings dates"""
+
+    def history(self, symbol: str, period: str = "2y") -> pd.DataFrame:
+        """Daily OHLC history indexed by date"""
+        raise NotImplementedError
+
+    def bulk_history(self, symbols: List[str], period: str = "6mo") -> pd.DataFrame:
+        """Daily history for many symbols, columns as (field, symbol)"""
+        raise NotImplementedError
+
+    def info(self, symbol: str) -> Dict:
+        raise NotImplementedError
+
+    def earnings_dates(self, symbol: str) -> List[date]:
+        raise NotImplementedError
+
+
+class YahooProvider(MarketDataProvider):
+    """Yahoo Finance through one pooled HTTP session.
+
+    Every call reuses the same session (and its connection pool) rather
+    than letting each request open fresh clients, and at most
+    `max_connections` calls are in flight to Yahoo at a time. A bulk
+    download counts as one call but fans out to at most `max_connections`
+    threads of its own; with the requests fallback session the blocking
+    connection pool caps the total as well.
+    """
+
+    def __init__(self, max_connections: int = 8):
+        self.max_connections = max_connections
+        self._limit = threading.BoundedSemaphore(max_connections)
+        self._session = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self):
+        with self._session_lock:
+            if self._session is None:
+                self._session = self._make_session()
+            return self._session
+
+    def _make_session(self):
+        try:
+            # Recent yfinance releases require curl_cffi sessions
+            from curl_cffi import requests as curl_requests
+            return curl_requests.Session(impersonate="chrome")
+        except ImportError:
+            import requests
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections,
+                                                    pool_block=True)
+            session.mount("https://", adapter)
+            return session
+
+    def _ticker(self, symbol: str):
+        import yfinance as yf
+        return yf.Ticker(symbol, session=self.session)
+
+    def history(self, symbol: str, period: str = "2y") -> pd.DataFrame:
+        with self._limit:
+            return self._ticker(symbol).history(period=period)
+
+    def bulk_history(self, symbols: List[str], period: str = "6mo") -> pd.DataFrame:
+        import yfinance as yf
+        with self._limit:
+            return yf.download(symbols, period=period, group_by='column', auto_adjust=False,
+                               threads=self.max_connections, progress=False, session=self.session)
+
+    def info(self, symbol: str) -> Dict:
+        with self._limit:
+            return self._ticker(symbol).info
+
+    def earnings_dates(self, symbol: str) -> List[date]:
+        with self._limit:
+            calendar = self._ticker(symbol).calendar
+        if calendar is None:
+            return []
+        # Newer yfinance returns a dict, older versions a DataFrame indexed by date
+        if isinstance(calendar, dict):
+            return [pd.to_datetime(d).date() for d in calendar.get('Earnings Date', [])]
+        if calendar.empty:
+            return []
+        return [pd.to_datetime(d).date() for d in calendar.index]
+
+
+class OfflineProvider(MarketDataProvider):
+    """Deterministic synthetic market data for tests, benchmarks and offline runs.
+
+    Prices are a random walk seeded from the symbol, so any symbol works and
+    repeated calls return the same data. `delay` simulates upstream latency
+    and `calls` counts upstream hits.
+    """
+
+    def __init__(self, delay: float = 0.0, end: Optional[date] = None):
+        self.delay = delay
+        self.end = end or datetime.now().date()
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+
+    def _hit(self):
+        with self._calls_lock:
+            self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+
+    @staticmethod
+    def _seed(symbol: str) -> int:
+        return int(hashlib.md5(symbol.encode()).hexdigest()[:8], 16)
+
+    @staticmethod
+    def _period_days(period: str) -> int:
+        units = {'d': 1, 'mo': 21, 'y': 252}
+        for suffix, days in units.items():
+            if period.endswith(suffix):
+                return int(period[:-len(suffix)]) * days
+        return 252
+
+    def _frame(self, symbol: str, period: str) -> pd.DataFrame:
+        days = self._period_days(period)
+        rng = np.random.default_rng(self._seed(symbol))
+        index = pd.bdate_range(end=pd.Timestamp(self.end), periods=days)
+
+        start_price = rng.uniform(20, 500)
+        volatility = rng.uniform(0.01, 0.04)
+        close = start_price * np.exp(np.cumsum(rng.normal(0, volatility, days)))
+        open_ = close * (1 + rng.normal(0, volatility / 2, days))
+        spread = np.abs(rng.normal(0, volatility, days)) * close
+
+        return pd.DataFrame({
+            'Open': open_,
+            'High': np.maximum(open_, close) + spread,
+            'Low': np.minimum(open_, close) - spread,
+            'Close': close,
+            'Volume': rng.integers(1_000_000, 50_000_000, days),
+        }, index=index)
+
+    def history(self, symbol: str, period: str = "2y") -> pd.DataFrame:
+        self._hit()
+        return self._frame(symbol, period)
+
+    def bulk_history(self, symbols: List[str], period: str = "6mo") -> pd.DataFrame:
+        self._hit()
+        frames = {symbol: self._frame(symbol, period) for symbol in symbols}
+        return pd.concat(frames, axis=1).swaplevel(axis=1).sort_index(axis=1)
+
+    def info(self, symbol: str) -> Dict:
+        self._hit()
+        return {'symbol': symbol, 'currentPrice': float(self._frame(symbol, "1mo")['Close'].iloc[-1])}
+
+    def earnings_dates(self, symbol: str) -> List[date]:
+        self._hit()
+        offset = self._seed(symbol) % 91
+        first = self.end - timedelta(days=730 - offset)
+        return [first + timedelta(days=91 * quarter) for quarter in range(9)]
+
+
+class CoalescingProvider(MarketDataProvider):
+    """Wraps a provider so concurrent identical fetches share one upstream call"""
+
+    def __init__(self, provider: MarketDataProvider):
+        self.provider = provider
+        self._flight = SingleFlight()
+
+    def history(self, symbol: str, period: str = "2y") -> pd.DataFrame:
+        return self._flight.do(('history', symbol, period), lambda: self.provider.history(symbol, period))
+
+    def bulk_history(self, symbols: List[str], period: str = "6mo") -> pd.DataFrame:
+        key = ('bulk_history', tuple(symbols), period)
+        return self._flight.do(key, lambda: self.provider.bulk_history(symbols, period))
+
+    def info(self, symbol: str) -> Dict:
+        return self._flight.do(('info', symbol), lambda: self.provider.info(symbol))
+
+    def earnings_dates(self, symbol: str) -> List[date]:
+        return self._flight.do(('earnings_dates', symbol), lambda: self.provider.earnings_dates(symbol))
+
+
+def yahoo_session():
+    """The shared provider's pooled Yahoo session, or None when another provider is configured"""
+    upstream = provider.provider if isinstance(provider, CoalescingProvider) else provider
+    return upstream.session if isinstance(upstream, YahooProvider) else None
+
+
+def provider_from_env() -> MarketDataProvider:
+    """MARKET_DATA_PROVIDER selects "yahoo" (default) or "offline" """
+    name = os.getenv("MARKET_DATA_PROVIDER", "yahoo")
+    if name == "yahoo":
+        provider = YahooProvider(max_connections=int(os.getenv("YAHOO_MAX_CONNECTIONS", 8)))
+    elif name == "offline":
+        provider = OfflineProvider()
+    else:
+        raise ValueError(f"Unknown MARKET_DATA_PROVIDER '{name}'")
+    return CoalescingProvider(provider)
+
+
+provider = provider_from_env()
@@ -0,0 +1,161 @@
+import pandas as pd
+import numpy as np
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Tuple
+
+from .data_collector import DataCollector
+from .model_trainer import sector_of
+from .earnings_calendar import HORIZON_DAYS
+
+SECTORS = ('tech', 'finance', 'healthcare', 'other')
+
+
+class UpcomingSnapshot:
+    """Precomputed features for every upcoming event in the tracked universe.
+
+    Prices for the whole universe are fetched in one bulk call and reduced to
+    per-event features with vectorized IV proxy and momentum calculations.
+    The snapshot is rebuilt every `ttl` seconds; `version` increments on
+    each rebuild so scores computed from it can be cached.
+
+    A failed rebuild keeps serving the last good snapshot, without a new
+    version, and is retried after `retry_after` seconds. Only when no
+    snapshot has been built yet does get raise, with the last error.
+    """
+
+    def __init__(self, horizon_days: int = HORIZON_DAYS, ttl: float = 900,
+                 retry_after: float = 60, collector: Optional[DataCollector] = None):
+        self.horizon_days = horizon_days
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.collector = collector
+        self.version = 0
+        self._features = None
+        self._built_at = 0.0
+        self._failed_at = None
+        self._error = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Tuple[pd.DataFrame, int]:
+        """Current feature frame and its version"""
+        with self._lock:
+            now = time.monotonic()
+            if self._due(now):
+                try:
+                    self._refresh()
+                except Exception as e:
+                    self._failed_at = now
+                    self._error = e
+                    print(f"Error building upcoming snapshot: {e}")
+
+            if self._features is None:
+                raise self._error
+            return self._features, self.version
+
+    def stale(self) -> bool:
+        """Whether the next get() would rebuild the snapshot"""
+        return self._due(time.monotonic())
+
+    def _due(self, now: float) -> bool:
+        stale = self._features is None or now - self._built_at > self.ttl
+        backing_off = self._failed_at is not None and now - self._failed_at < self.retry_after
+        return stale and not backing_off
+
+    def _refresh(self):
+        collector = self.collector or DataCollector()
+        features = collector.get_upcoming_features(self.horizon_days)
+        features['sector'] = sector_of(features['symbol'])
+
+        self._features = features
+        self._built_at = time.monotonic()
+        self._failed_at = None
+        self._error = None
+        self.version += 1
+        print(f"Built upcoming snapshot v{self.version} with {len(features)} events")
+
+
+class Screener:
+    """Scores and ranks the upcoming snapshot.
+
+    Scores for a snapshot version and model are computed once, in a single
+    batched model call, and reused by every screener request until either
+    changes. Requests only filter, select the top k and page.
+    """
+
+    def __init__(self, snapshot: UpcomingSnapshot):
+        self.snapshot = snapshot
+        self._scored = None
+        self._scored_version = None
+        self._scored_model = None
+        self._lock = threading.Lock()
+
+    def scored(self, predictor) -> pd.DataFrame:
+        features, version = self.snapshot.get()
+
+        with self._lock:
+            if self._scored_version != version or self._scored_model is not predictor.model:
+                scored = features.copy()
+                if len(scored):
+                    predicted = predictor.predict_batch(
+                        symbol=scored['symbol'].to_numpy(),
+                        iv_proxy=scored['iv_proxy'].to_numpy(dtype=float),
+                        momentum_20d=scored['momentum_20d'].to_numpy(dtype=float),
+                        beta_market=np.ones(len(scored)),
+                        prev_close=scored['current_price'].to_numpy(dtype=float)
+                    )
+                else:
+                    predicted = np.empty(0)
+                scored['predicted_gap_pct'] = predicted
+                scored['opportunity_score'] = scored['iv_proxy'].to_numpy(dtype=float) - predicted
+                self._scored = scored
+                self._scored_version = version
+                self._scored_model = predictor.model
+            return self._scored
+
+    def screen(self, predictor, sectors=None, min_price: Optional[float] = None,
+               max_price: Optional[float] = None, min_iv_proxy: Optional[float] = None,
+               max_days: Optional[int] = None, top_k: Optional[int] = None,
+               ascending: bool = False, offset: int = 0, limit: int = 50) -> Tuple[int, pd.DataFrame]:
+        """(number of ranked candidates, requested page of them)"""
+        scored = self.scored(predictor)
+        today = np.datetime64(datetime.now().date(), 'D')
+        days_to_event = (scored['earnings_date'].to_numpy(dtype='datetime64[D]') - today).astype(int)
+
+        mask = days_to_event >= 0
+        if sectors:
+            mask &= np.isin(scored['sector'].to_numpy(), list(sectors))
+        if min_price is not None:
+            mask &= scored['current_price'].to_numpy() >= min_price
+        if max_price is not None:
+            mask &= scored['current_price'].to_numpy() <= max_price
+        if min_iv_proxy is not None:
+            mask &= scored['iv_proxy'].to_numpy() >= min_iv_proxy
+        if max_days is not None:
+            mask &= days_to_event <= max_days
+
+        candidates = np.flatnonzero(mask)
+        score = scored['opportunity_score'].to_numpy()[candidates]
+        if not ascending:
+            score = -score
+
+        total = len(candidates) if top_k is None else min(top_k, len(candidates))
+        end = min(offset + limit, total)
+        if offset >= end:
+            return total, scored.iloc[[]].assign(days_to_event=[])
+
+        # Partial selection of the first `end` ranks, then sort only those
+        if end < len(candidates):
+            head = np.argpartition(score, end - 1)[:end]
+        else:
+            head = np.arange(len(candidates))
+        head = head[np.argsort(score[head], kind='stable')][offset:end]
+
+        rows = candidates[head]
+        page = scored.iloc[rows].assign(days_to_event=days_to_event[rows])
+        return total, page
+
+
+snapshot = UpcomingSnapshot()
+screener = Screener(snapshot)
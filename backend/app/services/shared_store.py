@@ -0,0 +1,111 @@
+import numpy as np
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from typing import Callable, Dict, Optional, Tuple
+
+Arrays = Dict[str, np.ndarray]
+
+
+def file_version(path: str) -> str:
+    """Short fingerprint of a file that changes whenever it is rewritten"""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(key.encode()).hexdigest()[:12]
+
+
+class SharedArrayStore:
+    """Versioned NumPy arrays published once and memory-mapped by every process.
+
+    Each published version is a directory of .npy files plus meta.json,
+    written to a temporary directory and renamed into place so readers
+    never see a partial version. Attaching maps the files read-only, so all
+    uvicorn workers share the same physical pages through the OS page cache.
+    """
+
+    def __init__(self, root: str = "backend/data/shared"):
+        self.root = root
+
+    def _version_dir(self, name: str, version: str) -> str:
+        return os.path.join(self.root, name, version)
+
+    def current_version(self, name: str) -> Optional[str]:
+        pointer = os.path.join(self.root, name, "CURRENT")
+        if not os.path.exists(pointer):
+            return None
+        with open(pointer) as f:
+            return f.read().strip() or None
+
+    def publish(self, name: str, version: str, arrays: Arrays, meta: Optional[dict] = None) -> str:
+        """Write a version (if not already published) and make it current"""
+        target = self._version_dir(name, version)
+
+        if not os.path.exists(target):
+            staging = os.path.join(self.root, name, f".staging-{uuid.uuid4().hex}")
+            os.makedirs(staging)
+            for key, array in arrays.items():
+                np.save(os.path.join(staging, f"{key}.npy"), np.ascontiguousarray(array))
+            with open(os.path.join(staging, "meta.json"), 'w') as f:
+                json.dump(meta or {}, f)
+
+            try:
+                os.rename(staging, target)
+            except OSError:
+                # Another process published the same version first
+                shutil.rmtree(staging, ignore_errors=True)
+
+        pointer = os.path.join(self.root, name, "CURRENT")
+        staging_pointer = f"{pointer}.{uuid.uuid4().hex}"
+        with open(staging_pointer, 'w') as f:
+            f.write(version)
+        os.replace(staging_pointer, pointer)
+
+        return target
+
+    def attach(self, name: str, version: Optional[str] = None) -> Tuple[Arrays, dict, str]:
+        """Memory-map a published version (the current one by default)"""
+        version = version or self.current_version(name)
+        if version is None:
+            raise FileNotFoundError(f"Nothing published under '{name}' in {self.root}")
+
+        directory = self._version_dir(name, version)
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Version {version} of '{name}' not found in {self.root}")
+
+        with open(os.path.join(directory, "meta.json")) as f:
+            meta = json.load(f)
+
+        arrays = {
+            filename[:-4]: np.load(os.path.join(directory, filename), mmap_mode='r')
+            for filename in os.listdir(directory) if filename.endswith(".npy")
+        }
+        return arrays, meta, version
+
+    def ensure(self, name: str, version: str,
+               build: Callable[[], Tuple[Arrays, dict]]) -> Tuple[Arrays, dict, str]:
+        """Attach to `version`, publishing it with `build()` first if missing"""
+        if not os.path.isdir(self._version_dir(name, version)):
+            arrays, meta = build()
+            self.publish(name, version, arrays, meta)
+            self.prune(name)
+        return self.attach(name, version)
+
+    def prune(self, name: str, keep: int = 2):
+        """Remove all but the newest `keep` versions.
+
+        Processes still mapping a removed version keep working: the pages
+        stay valid until they unmap.
+        """
+        directory = os.path.join(self.root, name)
+        current = self.current_version(name)
+        versions = [
+            entry for entry in os.listdir(directory)
+            if entry != current and not entry.startswith('.') and entry != "CURRENT"
+            and os.path.isdir(os.path.join(directory, entry))
+        ]
+        versions.sort(key=lambda entry: os.path.getmtime(os.path.join(directory, entry)), reverse=True)
+
+        for entry in versions[max(keep - 1, 0):]:
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
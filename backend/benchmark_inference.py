@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Inference backend benchmark
+Compares LightGBM and compiled model latency across batch sizes
+Run this after train_model.py; parity is covered by tests/test_compiled_model.py
+"""
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from backend.app.services.model_trainer import EarningsPredictor
+
+BATCH_SIZES = [1, 10, 100, 1000, 10000]
+REPEATS = 20
+
+def time_predict(model, X, repeats=REPEATS):
+    """Median wall time of model.predict in milliseconds"""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model.predict(X)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+def main(data_path="backend/data/historical_earnings.csv"):
+    lgbm = EarningsPredictor(backend="lightgbm")
+    compiled = EarningsPredictor(backend="compiled")
+
+    try:
+        lgbm.load_model()
+        compiled.load_model()
+    except FileNotFoundError as e:
+        print(f"Error: {e}")
+        print("Please run train_model.py first.")
+        sys.exit(1)
+
+    df = pd.read_csv(data_path)
+    features = lgbm.prepare_features(df)
+    X = features[lgbm.feature_columns]
+
+    print(f"{'batch':>8} {'lightgbm ms':>12} {'compiled ms':>12} {'speedup':>8}")
+    for batch_size in BATCH_SIZES:
+        batch = X.sample(n=batch_size, replace=True, random_state=0)
+        lgbm_ms = time_predict(lgbm.model, batch)
+        compiled_ms = time_predict(compiled.model, batch)
+        print(f"{batch_size:>8} {lgbm_ms:>12.3f} {compiled_ms:>12.3f} {lgbm_ms / compiled_ms:>7.1f}x")
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
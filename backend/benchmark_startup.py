@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+API startup benchmark
+Measures import time of main.py and time to first response, and fails when
+either exceeds its budget or a training-only dependency leaks into the serving import path
+"""
+
+import sys
+import os
+import json
+import socket
+import subprocess
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Budgets in seconds for a cold process on a small cloud instance
+IMPORT_BUDGET = 1.5
+FIRST_RESPONSE_BUDGET = 4.0
+RUNS = 5
+
+# Modules that serving must not import at startup
+TRAINING_ONLY_MODULES = ["sklearn", "lightgbm", "joblib", "yfinance", "bs4", "requests"]
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {modules!r} if m in sys.modules]}}))
+"""
+
+def measure_import():
+    """Import main.py in a fresh interpreter and report time and heavy modules loaded"""
+    probe = IMPORT_PROBE.format(modules=TRAINING_ONLY_MODULES)
+    result = subprocess.run([sys.executable, "-c", probe], cwd=BACKEND_DIR,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def measure_first_response(path="/api/predictions/model/status", timeout=30.0):
+    """Seconds from launching uvicorn until `path` answers"""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}{path}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            try:
+                with urllib.request.urlopen(url, timeout=1) as response:
+                    response.read()
+                    return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"No response from {url} within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    import_times = []
+    leaked = set()
+    for _ in range(RUNS):
+        result = measure_import()
+        import_times.append(result["seconds"])
+        leaked.update(result["loaded"])
+
+    response_times = [measure_first_response() for _ in range(RUNS)]
+
+    import_time = sorted(import_times)[RUNS // 2]
+    response_time = sorted(response_times)[RUNS // 2]
+
+    print(f"Import main.py:      {import_time:.3f}s (budget {IMPORT_BUDGET:.1f}s)")
+    print(f"Time to first reply: {response_time:.3f}s (budget {FIRST_RESPONSE_BUDGET:.1f}s)")
+    print(f"Training-only modules loaded at startup: {sorted(leaked) or 'none'}")
+
+    failures = []
+    if import_time > IMPORT_BUDGET:
+        failures.append("import time over budget")
+    if response_time > FIRST_RESPONSE_BUDGET:
+        failures.append("time to first response over budget")
+    if leaked:
+        failures.append(f"heavy modules imported at startup: {', '.join(sorted(leaked))}")
+
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("\nStartup within budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Load testing harness for the HTTP API
+Drives /upcoming, /history/{symbol}, /predict and /model/status from a scenario file
+and saves throughput, latency percentiles and error rates as a JSON report
+
+    python load_test.py run scenarios/dashboard.json
+    python load_test.py run scenarios/dashboard.json --url http://localhost:8000
+    python load_test.py compare baseline.json candidate.json
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+import platform
+import random
+import time
+from datetime import date, datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BACKEND_DIR)
+sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np
+
+ENDPOINTS = ("upcoming", "history", "predict", "model_status")
+
+# Regression thresholds for `compare`
+MAX_THROUGHPUT_DROP = 0.10
+MAX_LATENCY_INCREASE = 0.20
+MAX_ERROR_RATE_INCREASE = 0.01
+
+def load_scenario(path):
+    with open(path) as f:
+        scenario = json.load(f)
+
+    unknown = set(scenario["mix"]) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(f"Unknown endpoints in mix: {', '.join(sorted(unknown))}")
+
+    scenario.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    scenario.setdefault("warmup_s", 0)
+    scenario.setdefault("seed", 0)
+    scenario.setdefault("think_time_ms", 0)
+    return scenario
+
+def symbol_weights(spec):
+    """Sampling weights for the scenario's symbol list"""
+    n = len(spec["list"])
+    distribution = spec.get("distribution", "uniform")
+    if distribution == "zipf":
+        weights = 1.0 / np.arange(1, n + 1) ** spec.get("zipf_s", 1.0)
+    elif distribution == "uniform":
+        weights = np.ones(n)
+    else:
+        raise ValueError(f"Unknown symbol distribution '{distribution}'")
+    return (weights / weights.sum()).tolist()
+
+def build_request(endpoint, symbol, rng):
+    """(method, path, json body) for one request"""
+    if endpoint == "upcoming":
+        return "GET", "/api/earnings/upcoming", None
+    if endpoint == "history":
+        return "GET", f"/api/earnings/history/{symbol}", None
+    if endpoint == "model_status":
+        return "GET", "/api/predictions/model/status", None
+
+    # IV proxy and price are left out so the API fetches them through the provider
+    body = {
+        "symbol": symbol,
+        "earnings_date": (date.today() + timedelta(days=rng.randint(1, 14))).isoformat(),
+        "momentum_20d": round(rng.uniform(-15, 15), 2),
+        "beta_market": round(rng.uniform(0.5, 2.0), 2),
+    }
+    return "POST", "/api/predictions/predict", body
+
+def setup_offline_app(scenario):
+    """Import the app wired to the offline data provider and a synthetic calendar"""
+    os.environ["MARKET_DATA_PROVIDER"] = "offline"
+    # The app resolves its data and model paths ("backend/...") from the repo root
+    os.chdir(REPO_DIR)
+
+    import main
+    from app.services import earnings_calendar
+
+    rng = random.Random(scenario["seed"])
+    today = date.today()
+    earnings_calendar.calendar.source = earnings_calendar.StaticCalendarSource([
+        {"symbol": symbol, "earnings_date": today + timedelta(days=rng.randint(0, 13)),
+         "session": rng.choice(["BMO", "AMC"])}
+        for symbol in scenario["symbols"]["list"]
+    ])
+    return main.app
+
+async def run_scenario(scenario, url=None):
+    import httpx
+
+    if url:
+        client = httpx.AsyncClient(base_url=url, timeout=30)
+        target = url
+    else:
+        transport = httpx.ASGITransport(app=setup_offline_app(scenario))
+        client = httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=30)
+        target = "in-process (offline provider)"
+
+    endpoints = list(scenario["mix"])
+    endpoint_weights = [scenario["mix"][e] for e in endpoints]
+    symbols = scenario["symbols"]["list"]
+    weights = symbol_weights(scenario["symbols"])
+    think_time = scenario["think_time_ms"] / 1000
+
+    samples = []
+    start = time.perf_counter()
+    measure_from = start + scenario["warmup_s"]
+    stop_at = measure_from + scenario["duration_s"]
+
+    async def worker(worker_id):
+        rng = random.Random(scenario["seed"] * 1000 + worker_id)
+        while time.perf_counter() < stop_at:
+            endpoint = rng.choices(endpoints, endpoint_weights)[0]
+            symbol = rng.choices(symbols, weights)[0]
+            method, path, body = build_request(endpoint, symbol, rng)
+
+            sent = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                status = response.status_code
+            except Exception:
+                status = 0
+            done = time.perf_counter()
+
+            if sent >= measure_from and done <= stop_at:
+                samples.append((endpoint, done - sent, status))
+            if think_time:
+                await asyncio.sleep(think_time)
+
+    async with client:
+        await asyncio.gather(*(worker(i) for i in range(scenario["concurrency"])))
+
+    return {
+        "scenario": scenario,
+        "target": target,
+        "started_at": datetime.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": summarize(samples, scenario["duration_s"]),
+    }
+
+def summarize(samples, duration_s):
+    """Per-endpoint and overall throughput, latency percentiles and error rate"""
+    groups = {"overall": samples}
+    for endpoint in ENDPOINTS:
+        endpoint_samples = [s for s in samples if s[0] == endpoint]
+        if endpoint_samples:
+            groups[endpoint] = endpoint_samples
+
+    results = {}
+    for name, group in groups.items():
+        if not group:
+            continue
+        latencies_ms = np.array([s[1] for s in group]) * 1000
+        statuses = [s[2] for s in group]
+        # Server errors and failed requests; 4xx (e.g. 404 for an unknown symbol) are counted separately
+        errors = sum(1 for status in statuses if status == 0 or status >= 500)
+        client_errors = sum(1 for status in statuses if 400 <= status < 500)
+        status_counts = {}
+        for status in statuses:
+            status_counts[str(status)] = status_counts.get(str(status), 0) + 1
+
+        results[name] = {
+            "requests": len(group),
+            "throughput_rps": len(group) / duration_s,
+            "p50_ms": float(np.percentile(latencies_ms, 50)),
+            "p95_ms": float(np.percentile(latencies_ms, 95)),
+            "p99_ms": float(np.percentile(latencies_ms, 99)),
+            "error_rate": errors / len(group),
+            "client_error_rate": client_errors / len(group),
+            "status_counts": status_counts,
+        }
+    return results
+
+def print_results(results):
+    print(f"\n{'endpoint':<14} {'requests':>9} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'errors':>8} {'4xx':>8}")
+    for name, r in results.items():
+        print(f"{name:<14} {r['requests']:>9} {r['throughput_rps']:>9.1f} {r['p50_ms']:>9.1f} "
+              f"{r['p95_ms']:>9.1f} {r['p99_ms']:>9.1f} {r['error_rate']:>7.1%} {r['client_error_rate']:>7.1%}")
+
+def compare_reports(baseline, candidate):
+    """Print per-endpoint deltas and return a list of regressions"""
+    regressions = []
+    print(f"\n{'endpoint':<14} {'rps':>18} {'p95 ms':>18} {'p99 ms':>18} {'errors':>16} {'4xx':>16}")
+    for name, base in baseline["results"].items():
+        new = candidate["results"].get(name)
+        if new is None:
+            continue
+
+        def change(key):
+            return (new[key] - base[key]) / base[key] if base[key] else 0.0
+
+        # Reports from before 4xx were tracked have no client_error_rate
+        base_4xx = base.get("client_error_rate", 0.0)
+        new_4xx = new.get("client_error_rate", 0.0)
+
+        print(f"{name:<14} {base['throughput_rps']:>7.1f} -> {new['throughput_rps']:>7.1f} "
+              f"{base['p95_ms']:>7.1f} -> {new['p95_ms']:>7.1f} "
+              f"{base['p99_ms']:>7.1f} -> {new['p99_ms']:>7.1f} "
+              f"{base['error_rate']:>6.1%} -> {new['error_rate']:>6.1%} "
+              f"{base_4xx:>6.1%} -> {new_4xx:>6.1%}")
+
+        if change("throughput_rps") < -MAX_THROUGHPUT_DROP:
+            regressions.append(f"{name}: throughput down {-change('throughput_rps'):.0%}")
+        for key in ("p95_ms", "p99_ms"):
+            if change(key) > MAX_LATENCY_INCREASE:
+                regressions.append(f"{name}: {key[:3]} latency up {change(key):.0%}")
+        if new["error_rate"] - base["error_rate"] > MAX_ERROR_RATE_INCREASE:
+            regressions.append(f"{name}: error rate up {new['error_rate'] - base['error_rate']:.1%}")
+        if new_4xx - base_4xx > MAX_ERROR_RATE_INCREASE:
+            regressions.append(f"{name}: 4xx rate up {new_4xx - base_4xx:.1%}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Earnings Predictor API")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run a scenario and save a report")
+    run.add_argument("scenario", help="Scenario JSON file")
+    run.add_argument("--url", help="Base URL of a running API (default: in-process app with offline provider)")
+    run.add_argument("--duration", type=float, help="Override the scenario duration in seconds")
+    run.add_argument("--concurrency", type=int, help="Override the scenario concurrency")
+    run.add_argument("--output", help="Report path (default: data/loadtest/<scenario>-<timestamp>.json)")
+
+    compare = commands.add_parser("compare", help="Compare two reports and fail on capacity regressions")
+    compare.add_argument("baseline")
+    compare.add_argument("candidate")
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.candidate) as f:
+            candidate = json.load(f)
+
+        regressions = compare_reports(baseline, candidate)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\nNo capacity regressions")
+        return
+
+    scenario = load_scenario(args.scenario)
+    # Resolved now, since the in-process app changes the working directory
+    if args.output:
+        args.output = os.path.abspath(args.output)
+    if args.duration:
+        scenario["duration_s"] = args.duration
+    if args.concurrency:
+        scenario["concurrency"] = args.concurrency
+
+    print(f"Running '{scenario['name']}': {scenario['concurrency']} concurrent clients "
+          f"for {scenario['duration_s']}s (+{scenario['warmup_s']}s warmup)")
+    report = asyncio.run(run_scenario(scenario, args.url))
+    print_results(report["results"])
+
+    output = args.output or os.path.join(
+        BACKEND_DIR, "data", "loadtest", f"{scenario['name']}-{datetime.now():%Y%m%d-%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved report to {output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+from typing import Optional
+from fastapi import FastAPI, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from app.routes import earnings, predictions
+from app.services.events import broadcaster
 import uvicorn
 
 app = FastAPI(title="Earnings Predictor API", version="1.0.0")
@@ -20,6 +23,15 @@ app.include_router(predictions.router, prefix="/api/predictions", tags=["predict
 async def root():
     return {"message": "Earnings Predictor API"}
 
+@app.get("/api/events")
+async def events(last_event_id: Optional[str] = Header(None)):
+    """Server-sent events with model, dataset and upcoming snapshot versions, sent on every change"""
+    return StreamingResponse(
+        broadcaster.stream(last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 if __name__ == "__main__":
     import os
     port = int(os.getenv("PORT", 8000))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Walk-forward backtest script
+Retrains the model period by period and reports how the opportunity score ranking performed
+"""
+
+import sys
+import os
+import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from backend.app.services.backtester import WalkForwardBacktester
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--data", default="backend/data/historical_earnings.csv", help="Historical dataset CSV")
+    parser.add_argument("--step", default="QS", help="Walk-forward period as a pandas frequency (default: quarterly)")
+    parser.add_argument("--min-train", type=int, default=200, help="Minimum events before the first step")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", default="backend/data/backtest_results.csv", help="Where to save scored events")
+    args = parser.parse_args()
+
+    backtester = WalkForwardBacktester(
+        data_path=args.data,
+        step=args.step,
+        min_train_events=args.min_train,
+        max_workers=args.workers
+    )
+
+    try:
+        results = backtester.run()
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    events = results['events']
+    deciles = results['deciles']
+
+    print(f"\nScored {len(events)} out-of-sample events in {results['steps']} steps")
+    with pd.option_context('display.float_format', '{:.3f}'.format, 'display.max_columns', None, 'display.width', 160):
+        print(deciles)
+
+    spread = deciles['mean_pnl'].iloc[-1] - deciles['mean_pnl'].iloc[0]
+    print(f"\nOverall hit rate: {events['hit'].mean():.1%}")
+    print(f"Top-minus-bottom decile mean PnL: {spread:.3f}%")
+
+    events.to_csv(args.output, index=False)
+    print(f"Saved scored events to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from app.services.compiled_model import CompiledTreeEnsemble, MISSING_NAN, MISSING_NONE, MISSING_ZERO
+
+lightgbm = pytest.importorskip("lightgbm")
+
+PARITY_TOLERANCE = 1e-9
+N_FEATURES = 5
+
+
+def synthetic_data(n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, N_FEATURES))
+    y = 2 * X[:, 0] - X[:, 1] ** 2 + np.where(X[:, 2] > 0, 1.5, -0.5) + rng.normal(scale=0.1, size=n)
+    return X, y
+
+
+def fit(X, y, **params):
+    model = lightgbm.LGBMRegressor(n_estimators=50, num_leaves=15, random_state=0, verbose=-1, **params)
+    return model.fit(X, y)
+
+
+def with_missing(X, seed=1):
+    """Copy of X with NaNs and exact zeros scattered over every feature"""
+    rng = np.random.default_rng(seed)
+    X = X.copy()
+    X[rng.random(X.shape) < 0.1] = np.nan
+    X[rng.random(X.shape) < 0.1] = 0.0
+    return X
+
+
+def assert_parity(model, X):
+    compiled = CompiledTreeEnsemble.from_lightgbm(model)
+    diff = np.abs(model.predict(X) - compiled.predict(X)).max()
+    assert diff <= PARITY_TOLERANCE
+    return compiled
+
+
+def test_parity_without_missing_splits():
+    X, y = synthetic_data()
+    model = fit(X, y)
+
+    compiled = assert_parity(model, X)
+    assert (compiled.missing_type == MISSING_NONE).all()
+    # NaN inputs to splits that never saw missing values are treated as zero
+    assert_parity(model, with_missing(X))
+
+
+def test_parity_with_nan_splits():
+    X, y = synthetic_data()
+    X_train = with_missing(X)
+    model = fit(X_train, y)
+
+    compiled = assert_parity(model, X_train)
+    assert (compiled.missing_type == MISSING_NAN).any()
+    assert_parity(model, with_missing(X, seed=2))
+
+
+def test_parity_with_zero_splits():
+    X, y = synthetic_data()
+    X_train = with_missing(X)
+    model = fit(X_train, y, zero_as_missing=True)
+
+    compiled = assert_parity(model, X_train)
+    assert (compiled.missing_type == MISSING_ZERO).any()
+    assert_parity(model, with_missing(X, seed=2))
+
+
+def test_parity_on_single_rows():
+    X, y = synthetic_data()
+    model = fit(with_missing(X), y)
+    compiled = CompiledTreeEnsemble.from_lightgbm(model)
+
+    for row in with_missing(X[:20], seed=3):
+        assert abs(model.predict(row.reshape(1, -1))[0] - compiled.predict(row)[0]) <= PARITY_TOLERANCE
+
+
+def test_array_round_trip(tmp_path):
+    X, y = synthetic_data()
+    X_missing = with_missing(X)
+    compiled = CompiledTreeEnsemble.from_lightgbm(fit(X_missing, y, zero_as_missing=True))
+    expected = compiled.predict(X_missing)
+
+    arrays, meta = compiled.to_arrays()
+    rebuilt = CompiledTreeEnsemble.from_arrays(arrays, meta)
+    assert rebuilt.max_depth == compiled.max_depth
+    assert rebuilt.feature_names == compiled.feature_names
+    np.testing.assert_array_equal(rebuilt.predict(X_missing), expected)
+
+    path = tmp_path / "model.npz"
+    compiled.save(str(path))
+    np.testing.assert_array_equal(CompiledTreeEnsemble.load(str(path)).predict(X_missing), expected)
@@ -0,0 +1,39 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.providers import CoalescingProvider, OfflineProvider
+
+THREADS = 16
+UPSTREAM_DELAY = 0.2
+
+
+def fetch_concurrently(provider, symbols, threads=THREADS):
+    """provider.history for each symbol in turn, from `threads` threads at once"""
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(lambda i: provider.history(symbols[i % len(symbols)], "1y"), range(threads)))
+
+
+def test_concurrent_identical_fetches_make_one_upstream_call():
+    upstream = OfflineProvider(delay=UPSTREAM_DELAY)
+    frames = fetch_concurrently(CoalescingProvider(upstream), ["AAPL"])
+
+    assert upstream.calls == 1
+    assert all(frame is frames[0] for frame in frames)
+
+
+def test_distinct_symbols_fetch_separately():
+    upstream = OfflineProvider(delay=UPSTREAM_DELAY)
+    symbols = ["AAPL", "MSFT", "NVDA", "JPM"]
+    frames = fetch_concurrently(CoalescingProvider(upstream), symbols)
+
+    assert upstream.calls == len(symbols)
+    assert not frames[0].equals(frames[1])
+
+
+def test_nothing_is_cached_after_a_call():
+    upstream = OfflineProvider()
+    provider = CoalescingProvider(upstream)
+
+    provider.history("AAPL", "1y")
+    provider.history("AAPL", "1y")
+
+    assert upstream.calls == 2
@@ -6,17 +6,42 @@ Run this after collecting data to train the earnings prediction model
 
 import sys
 import os
+import argparse
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.app.services.model_trainer import EarningsPredictor
 
 def main():
+    parser = argparse.ArgumentParser(description="Train the earnings prediction model")
+    parser.add_argument("--data", default="backend/data/historical_earnings.csv", help="Historical dataset CSV")
+    parser.add_argument("--out-of-core", action="store_true",
+                        help="Stream the dataset in chunks instead of loading it into memory")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Rows per chunk for --out-of-core")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Continue boosting the saved model on new events; falls back to a full rebuild when due")
+    parser.add_argument("--rounds", type=int, default=20, help="Trees added per --incremental update")
+    parser.add_argument("--full-rebuild-days", type=int, default=30,
+                        help="Force a full rebuild when the last one is older than this")
+    parser.add_argument("--drift-threshold", type=float, default=0.25,
+                        help="Force a full rebuild when MAE on new events exceeds the last full rebuild's CV MAE by this fraction")
+    parser.add_argument("--compare-full", action="store_true",
+                        help="Also fit a full rebuild in memory and record its metrics next to the update's")
+    args = parser.parse_args()
+    
     print("Starting model training...")
     
     predictor = EarningsPredictor()
     
     try:
-        model = predictor.train_model()
+        if args.incremental:
+            model = predictor.update_model(
+                args.data, rounds=args.rounds, full_rebuild_days=args.full_rebuild_days,
+                drift_threshold=args.drift_threshold, compare_full=args.compare_full
+            )
+        elif args.out_of_core:
+            model = predictor.train_model_out_of_core(args.data, chunksize=args.chunksize)
+        else:
+            model = predictor.train_model(args.data)
         print("Model training completed successfully!")
         
         # Test prediction
@@ -1,12 +1,36 @@
-import { useState } from 'react';
-import { useQuery } from '@tanstack/react-query';
-import { earningsApi } from './utils/api';
+import { useEffect, useState } from 'react';
+import { useQuery, useQueryClient } from '@tanstack/react-query';
+import { earningsApi, subscribeToVersions } from './utils/api';
+import { VersionEvent, VersionedResource } from './types';
 import EarningsTable from './components/EarningsTable';
 import EarningsChart from './components/EarningsChart';
 import ModelStatus from './components/ModelStatus';
 
+// Queries to refetch when a server-side resource gets a new version
+const QUERIES_BY_RESOURCE: Record<VersionedResource, string[]> = {
+  model: ['modelStatus', 'upcomingEarnings'],
+  dataset: ['earningsHistory'],
+  snapshot: ['upcomingEarnings'],
+};
+
 function App() {
   const [selectedSymbol, setSelectedSymbol] = useState<string | null>(null);
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    let seen: VersionEvent['versions'] | null = null;
+
+    return subscribeToVersions((event) => {
+      // The first event is the baseline; after that diff against it, which also covers reconnects
+      if (seen) {
+        const changed = (Object.keys(event.versions) as VersionedResource[])
+          .filter((resource) => event.versions[resource] !== seen![resource]);
+        const keys = new Set(changed.flatMap((resource) => QUERIES_BY_RESOURCE[resource]));
+        keys.forEach((key) => queryClient.invalidateQueries({ queryKey: [key] }));
+      }
+      seen = event.versions;
+    });
+  }, [queryClient]);
 
   const { data: upcomingEarnings, isLoading, error } = useQuery({
     queryKey: ['upcomingEarnings'],
@@ -6,12 +6,14 @@ import { earningsApi } from '../utils/api';
 
 interface EarningsChartProps {
   symbol: string;
+  maxPoints?: number;
 }
 
-const EarningsChart: React.FC<EarningsChartProps> = ({ symbol }) => {
+const EarningsChart: React.FC<EarningsChartProps> = ({ symbol, maxPoints = 200 }) => {
+  // The server downsamples to maxPoints and sends whole-history averages
   const { data, isLoading, error } = useQuery({
-    queryKey: ['earningsHistory', symbol],
-    queryFn: () => earningsApi.getHistory(symbol),
+    queryKey: ['earningsHistory', symbol, maxPoints],
+    queryFn: () => earningsApi.getHistory(symbol, maxPoints),
   });
 
   if (isLoading) {
@@ -76,6 +78,13 @@ const EarningsChart: React.FC<EarningsChartProps> = ({ symbol }) => {
     date: item.earnings_date,
   }));
 
+  const count = data.historical_data.length;
+  const averages = data.summary ?? {
+    mean_iv_proxy: data.historical_data.reduce((sum, item) => sum + item.iv_proxy, 0) / count,
+    mean_realized_vol: data.historical_data.reduce((sum, item) => sum + item.five_day_realized_vol, 0) / count,
+    mean_abs_gap_pct: data.historical_data.reduce((sum, item) => sum + Math.abs(item.overnight_gap_pct), 0) / count,
+  };
+
   const formatTooltip = (value: number, name: string) => {
     return [`${value.toFixed(1)}%`, name];
   };
@@ -90,6 +99,11 @@ const EarningsChart: React.FC<EarningsChartProps> = ({ symbol }) => {
         <h3 className="text-lg font-semibold text-gray-900 mb-4">
           {symbol} - Historical IV vs RV Trends
         </h3>
+        {data.downsampled && (
+          <p className="text-sm text-gray-500 mb-2">
+            Showing {count} of {data.total_events} events
+          </p>
+        )}
         
         <div className="h-80 w-full">
           <ResponsiveContainer width="100%" height="100%">
@@ -187,19 +201,19 @@ const EarningsChart: React.FC<EarningsChartProps> = ({ symbol }) => {
           <div className="bg-blue-50 p-4 rounded-lg">
             <div className="text-sm font-medium text-blue-800">Average IV Proxy</div>
             <div className="text-xl font-bold text-blue-900">
-              {(data.historical_data.reduce((sum, item) => sum + item.iv_proxy, 0) / data.historical_data.length).toFixed(1)}%
+              {averages.mean_iv_proxy.toFixed(1)}%
             </div>
           </div>
           <div className="bg-green-50 p-4 rounded-lg">
             <div className="text-sm font-medium text-green-800">Average Realized Vol</div>
             <div className="text-xl font-bold text-green-900">
-              {(data.historical_data.reduce((sum, item) => sum + item.five_day_realized_vol, 0) / data.historical_data.length).toFixed(1)}%
+              {averages.mean_realized_vol.toFixed(1)}%
             </div>
           </div>
           <div className="bg-yellow-50 p-4 rounded-lg">
             <div className="text-sm font-medium text-yellow-800">Average Actual Move</div>
             <div className="text-xl font-bold text-yellow-900">
-              {(data.historical_data.reduce((sum, item) => sum + Math.abs(item.overnight_gap_pct), 0) / data.historical_data.length).toFixed(1)}%
+              {averages.mean_abs_gap_pct.toFixed(1)}%
             </div>
           </div>
         </div>
@@ -6,6 +6,8 @@ const ModelStatus: React.FC = () => {
   const { data: modelStatus, isLoading, error } = useQuery({
     queryKey: ['modelStatus'],
     queryFn: predictionsApi.getModelStatus,
+    // Refetched when the event stream reports a new model
+    staleTime: Infinity,
   });
 
   if (isLoading) {
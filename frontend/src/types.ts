@@ -1,6 +1,7 @@
 export interface UpcomingEarnings {
   symbol: string;
   earnings_date: string;
+  session?: 'BMO' | 'AMC' | 'UNKNOWN';
   current_price: number;
   iv_proxy: number;
   predicted_gap_pct?: number;
@@ -20,9 +21,25 @@ export interface HistoricalEarningsData {
   past_surprise?: number;
 }
 
+export interface HistoryAggregate {
+  period: string;
+  start_date: string;
+  events: number;
+  mean_gap_pct: number;
+  mean_abs_gap_pct: number;
+  mean_iv_proxy: number;
+  mean_realized_vol: number;
+}
+
+export type HistoryAggregatePeriod = 'quarter' | 'year';
+
 export interface EarningsHistoryResponse {
   symbol: string;
   historical_data: HistoricalEarningsData[];
+  total_events?: number;
+  downsampled?: boolean;
+  summary?: HistoryAggregate;
+  aggregates?: HistoryAggregate[];
 }
 
 export interface PredictionRequest {
@@ -40,4 +57,56 @@ export interface PredictionResult {
   predicted_gap_pct: number;
   iv_proxy: number;
   opportunity_score: number;
-}
\ No newline at end of file
+}
+
+export interface SurfaceRange {
+  min: number;
+  max: number;
+  steps?: number;
+}
+
+export interface PredictionSurfaceRequest {
+  symbol: string;
+  earnings_date?: string;
+  current_price?: number;
+  iv_proxy: SurfaceRange;
+  momentum_20d?: SurfaceRange;
+  beta_market?: SurfaceRange;
+}
+
+export interface PredictionSurface {
+  symbol: string;
+  earnings_date: string;
+  current_price: number;
+  iv_proxy_values: number[];
+  momentum_20d_values: number[];
+  beta_market_values: number[];
+  // Indexed [iv_proxy][momentum_20d][beta_market]
+  predicted_gap_pct: number[][][];
+  opportunity_score: number[][][];
+}
+
+export type VersionedResource = 'model' | 'dataset' | 'snapshot';
+
+export interface VersionEvent {
+  id: string;
+  versions: Record<VersionedResource, string | null>;
+  changed: VersionedResource[];
+}
+
+export interface PredictionExplanation {
+  symbol: string;
+  earnings_date: string;
+  iv_proxy: number;
+  current_price: number;
+  predicted_gap_pct: number;
+  base_value: number;
+  contributions: Record<string, number>;
+  input_contributions: Record<string, number>;
+}
+
+export interface ExplanationResponse {
+  model_version: string;
+  feature_importances: Record<string, number>;
+  explanations: PredictionExplanation[];
+}
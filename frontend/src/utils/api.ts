@@ -1,5 +1,5 @@
 import axios from 'axios';
-import { UpcomingEarnings, EarningsHistoryResponse, PredictionRequest, PredictionResult } from '../types';
+import { UpcomingEarnings, EarningsHistoryResponse, HistoryAggregatePeriod, PredictionRequest, PredictionResult, PredictionSurfaceRequest, PredictionSurface, VersionEvent, ExplanationResponse } from '../types';
 
 const API_BASE = import.meta.env.VITE_API_BASE || 'http://localhost:8000';
 
@@ -14,8 +14,14 @@ export const earningsApi = {
     return response.data;
   },
 
-  getHistory: async (symbol: string): Promise<EarningsHistoryResponse> => {
-    const response = await api.get(`/api/earnings/history/${symbol}`);
+  getHistory: async (
+    symbol: string,
+    points?: number,
+    aggregate?: HistoryAggregatePeriod
+  ): Promise<EarningsHistoryResponse> => {
+    const response = await api.get(`/api/earnings/history/${symbol}`, {
+      params: { points, aggregate },
+    });
     return response.data;
   },
 
@@ -31,6 +37,16 @@ export const predictionsApi = {
     return response.data;
   },
 
+  getSurface: async (request: PredictionSurfaceRequest): Promise<PredictionSurface> => {
+    const response = await api.post('/api/predictions/surface', request);
+    return response.data;
+  },
+
+  explain: async (requests: PredictionRequest[]): Promise<ExplanationResponse> => {
+    const response = await api.post('/api/predictions/explain', { predictions: requests });
+    return response.data;
+  },
+
   getModelStatus: async (): Promise<any> => {
     const response = await api.get('/api/predictions/model/status');
     return response.data;
@@ -40,4 +56,11 @@ export const predictionsApi = {
     const response = await api.post('/api/predictions/model/retrain');
     return response.data;
   },
-};
\ No newline at end of file
+};
+
+// Server-sent version events; EventSource reconnects on its own. Returns an unsubscribe function.
+export const subscribeToVersions = (onEvent: (event: VersionEvent) => void): (() => void) => {
+  const source = new EventSource(`${API_BASE}/api/events`);
+  source.addEventListener('versions', (e) => onEvent(JSON.parse((e as MessageEvent).data)));
+  return () => source.close();
+};